@@ -0,0 +1,272 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from controller import Controller, StudentXMLWriter
+from model import Database
+
+
+STARTUP_BUDGET = 0.5
+SUITE_SIZES = [10000, 100000, 1000000]
+SUITE_REPEAT = 3
+PAGE_SIZE = 5
+IMPORT_BUDGET = 0.2
+IMPORT_MODULES = ["model", "controller", "cli"]
+GUI_MODULES = ("tkinter", "_tkinter")
+IMPORT_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(elapsed, any(name in sys.modules for name in {gui!r}))\n")
+
+SURNAMES = ["Иванов", "Петров", "Сидоров", "Смирнов", "Кузнецов",
+            "Морозов", "Волков", "Зайцев", "Новиков"]
+NAMES = ["Петр", "Иван", "Сергей", "Мария", "Анна", "Дмитрий",
+         "Екатерина", "Ольга", "Андрей", "Наталья", "Алексей"]
+SUBJECTS = ["Математика", "Физика", "Право", "Литература", "Физкультура",
+            "Экономика", "Химия", "История", "Информатика", "Биология",
+            "ОБЖ"]
+
+
+def generate_students(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        subjects = rng.sample(SUBJECTS, rng.randint(2, 5))
+        yield {
+            "fio": f"{rng.choice(SURNAMES)} {rng.choice(NAMES)} "
+                   f"{rng.choice(SURNAMES)}ович",
+            "group": str(rng.randint(100000, 999999)),
+            "exams": {subject: rng.randint(1, 10) for subject in subjects}
+        }
+
+
+def build_database(path, count, seed=0):
+    db = Database(path)
+    db.add_students_bulk(generate_students(count, seed), chunk_size=10000,
+                         fast=True)
+    del db
+
+
+def write_xml(path, count, seed=0):
+    with open(path, 'wb') as f:
+        writer = StudentXMLWriter(f)
+        writer.start()
+        for student in generate_students(count, seed):
+            writer.write_student(student)
+        writer.end()
+
+
+def write_sql(path, db_path):
+    controller = Controller(Database(db_path))
+    controller.save_to_sql(path)
+    controller.db.close()
+
+
+def prepare_fixtures(directory, count, seed=0):
+    prefix = os.path.join(directory, f"students_{count}_{seed}")
+    paths = {"xml": prefix + ".xml", "db": prefix + ".db",
+             "sql": prefix + ".sql"}
+    if not os.path.exists(paths["xml"]):
+        write_xml(paths["xml"], count, seed)
+    if not os.path.exists(paths["db"]):
+        build_database(paths["db"], count, seed)
+    if not os.path.exists(paths["sql"]):
+        write_sql(paths["sql"], paths["db"])
+    return paths
+
+
+def measure(operation, repeat=1, setup=None):
+    runs = []
+    rows = None
+    ok = True
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        result = operation()
+        runs.append(time.perf_counter() - start)
+        ok = ok and result is not False and not isinstance(result, str)
+        if isinstance(result, list):
+            rows = len(result)
+        elif isinstance(result, tuple):
+            rows = result[0]
+    return {"best": min(runs), "median": statistics.median(runs),
+            "runs": runs, "rows": rows, "ok": ok}
+
+
+def fresh_controller(path):
+    if os.path.exists(path):
+        os.remove(path)
+    return Controller(Database(path))
+
+
+def bench_size(directory, count, seed=0, repeat=SUITE_REPEAT):
+    fixtures = prepare_fixtures(directory, count, seed)
+    work = os.path.join(directory, "work")
+    os.makedirs(work, exist_ok=True)
+    results = {}
+
+    controller = fresh_controller(os.path.join(work, "load_xml.db"))
+    results["load"] = measure(lambda: controller.load(fixtures["xml"]))
+    controller.db.close()
+
+    controller = fresh_controller(os.path.join(work, "load_xml_fast.db"))
+    results["load_fast"] = measure(
+        lambda: controller.load(fixtures["xml"], fast=True))
+    results["save_to_xml"] = measure(
+        lambda: controller.save_to_xml(os.path.join(work, "out.xml")),
+        repeat)
+    results["save_to_sql"] = measure(
+        lambda: controller.save_to_sql(os.path.join(work, "out.sql")),
+        repeat)
+    controller.db.close()
+
+    controller = fresh_controller(os.path.join(work, "load_sql.db"))
+    results["load_from_sql"] = measure(
+        lambda: controller.load_from_sql(fixtures["sql"]))
+    controller.db.close()
+
+    controller = fresh_controller(os.path.join(work, "queries.db"))
+    controller.load(fixtures["xml"], fast=True)
+    sample = next(generate_students(1, seed))
+    searches = {
+        "search_by_group": lambda: controller.search_by_group(
+            sample["group"]),
+        "search_by_fio": lambda: controller.search_by_fio(
+            " ".join(sample["fio"].split()[:2])),
+        "search_by_avg_grade": lambda: controller.search_by_avg_grade(
+            "Математика", 5, 8),
+        "search_by_exam_grade": lambda: controller.search_by_exam_grade(
+            "Физика", 7, 10),
+    }
+    for name, search in searches.items():
+        results[name] = measure(search, repeat, controller.invalidate_cache)
+
+    total = controller.db.get_total_items()
+    for label, offset in (("first", 0), ("middle", total // 2),
+                          ("last", max(total - PAGE_SIZE, 0))):
+        results[f"get_paginated_students_{label}"] = dict(
+            measure(lambda: controller.db.get_paginated_students(
+                PAGE_SIZE, offset), repeat),
+            offset=offset)
+
+    victims = controller.search_by_exam_grade("Физика", 7, 10)
+    results["delete"] = measure(lambda: controller.delete(victims))
+    controller.db.close()
+    return results
+
+
+def run_suite(sizes, output, directory=None, seed=0, repeat=SUITE_REPEAT):
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "imports": {module: bench_import(module)
+                    for module in IMPORT_MODULES},
+        "sizes": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in sizes:
+            print(f"{count} students...")
+            report["sizes"][str(count)] = bench_size(
+                directory or tmp, count, seed, repeat)
+            for name, result in report["sizes"][str(count)].items():
+                print(f"  {name}: {result['best']:.4f} s")
+
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return report
+
+
+def bench_import(module, repeat=5):
+    directory = os.path.dirname(os.path.abspath(__file__))
+    probe = IMPORT_PROBE.format(module=module, gui=GUI_MODULES)
+    runs = []
+    gui = False
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", probe], cwd=directory,
+            capture_output=True, text=True, check=True).stdout.split()
+        runs.append(float(output[0]))
+        gui = gui or output[1] == "True"
+    return {"best": min(runs), "median": statistics.median(runs),
+            "runs": runs, "gui": gui}
+
+
+def check_imports(budget=IMPORT_BUDGET, modules=IMPORT_MODULES):
+    ok = True
+    for module in modules:
+        result = bench_import(module)
+        print(f"import {module}: {result['best']:.3f} s "
+              f"(budget {budget:.3f} s)"
+              + (", tkinter загружен" if result['gui'] else ""))
+        ok = ok and not result['gui'] and result['best'] <= budget
+    return ok
+
+
+def bench_startup(path, records_per_page=5):
+    from view import Paginator
+
+    start = time.perf_counter()
+    controller = Controller(Database(path))
+    paginator = Paginator(controller, records_per_page)
+    paginator.get_paginated_data()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Замер производительности на синтетических данных")
+    parser.add_argument("--students", type=int, default=100000)
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET)
+    parser.add_argument("--suite", action="store_true",
+                        help="полный набор замеров с записью в JSON")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SUITE_SIZES)
+    parser.add_argument("--repeat", type=int, default=SUITE_REPEAT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-dir",
+                        help="каталог для повторного использования данных")
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--imports", action="store_true",
+                        help="проверить время импорта модулей без GUI")
+    parser.add_argument("--import-budget", type=float,
+                        default=IMPORT_BUDGET)
+    args = parser.parse_args()
+
+    if args.imports:
+        if not check_imports(args.import_budget):
+            sys.exit(1)
+        return
+
+    if args.suite:
+        if args.data_dir:
+            os.makedirs(args.data_dir, exist_ok=True)
+        run_suite(args.sizes, args.output, args.data_dir, args.seed,
+                  args.repeat)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "students.db")
+        build_database(path, args.students)
+        elapsed = bench_startup(path)
+
+    print(f"startup: {elapsed:.3f} s ({args.students} students, "
+          f"budget {args.budget:.3f} s)")
+    if elapsed > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
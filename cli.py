@@ -0,0 +1,142 @@
+import argparse
+import json
+import os
+import sys
+
+from controller import Controller
+from model import Database
+
+
+def print_progress(done, total):
+    if total:
+        sys.stderr.write(f"\r{done * 100 // total}%")
+    else:
+        sys.stderr.write(f"\r{done}")
+    sys.stderr.flush()
+
+
+def write_records(records, output_format):
+    if output_format == "jsonl":
+        for record in records:
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+    else:
+        json.dump(records, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+
+
+def run_file_command(args, controller, progress):
+    operations = {
+        "import-xml": lambda: controller.load(
+            args.file, progress, args.fast),
+        "import-sql": lambda: controller.load_from_sql(args.file, progress),
+        "export-xml": lambda: controller.save_to_xml(
+            args.file, not args.compact, progress),
+        "export-sql": lambda: controller.save_to_sql(args.file, progress),
+    }
+    result = operations[args.command]()
+    if progress:
+        sys.stderr.write("\n")
+    if not result:
+        print(f"Ошибка: не удалось выполнить {args.command} {args.file}",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_search(args, controller):
+    if args.by == "group":
+        result = controller.search_by_group(args.value)
+    elif args.by == "fio":
+        result = controller.search_by_fio(args.value)
+    elif args.by == "avg-grade":
+        result = controller.search_by_avg_grade(
+            args.subject, args.min, args.max)
+    else:
+        result = controller.search_by_exam_grade(
+            args.subject, args.min, args.max)
+
+    if not isinstance(result, list):
+        print(f"Ошибка: {result or 'поиск не выполнен'}", file=sys.stderr)
+        return 2
+    write_records(result, args.format)
+    return 0
+
+
+def run_stats(args, controller):
+    if args.kind == "groups":
+        result = controller.get_group_stats()
+    elif args.kind == "subjects":
+        result = controller.get_subject_stats()
+    else:
+        result = controller.get_top_students(args.limit)
+    write_records(result, args.format)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m cli",
+        description="Работа с базой студентов без графического интерфейса")
+    parser.add_argument("--db", default="students.db",
+                        help="файл базы данных (по умолчанию students.db)")
+    parser.add_argument("--progress", action="store_true",
+                        help="показывать прогресс в stderr")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for command, help_text in (
+            ("import-xml", "загрузить студентов из XML"),
+            ("import-sql", "загрузить студентов из SQL-дампа"),
+            ("export-xml", "сохранить базу в XML"),
+            ("export-sql", "сохранить базу в SQL-дамп")):
+        file_parser = commands.add_parser(command, help=help_text)
+        file_parser.add_argument("file")
+        if command == "import-xml":
+            file_parser.add_argument(
+                "--fast", action="store_true",
+                help="журнал в памяти и без fsync: быстрее, но сбой во "
+                     "время загрузки может повредить базу")
+        if command == "export-xml":
+            file_parser.add_argument("--compact", action="store_true",
+                                     help="без отступов")
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--format", choices=["json", "jsonl"],
+                        default="json", help="формат вывода")
+
+    search = commands.add_parser("search", help="поиск студентов")
+    criteria = search.add_subparsers(dest="by", required=True)
+    criteria.add_parser("group", parents=[output]).add_argument("value")
+    criteria.add_parser("fio", parents=[output]).add_argument("value")
+    for name, grade_type in (("avg-grade", int), ("exam-grade", float)):
+        grade_parser = criteria.add_parser(name, parents=[output])
+        grade_parser.add_argument("subject")
+        grade_parser.add_argument("min", type=grade_type)
+        grade_parser.add_argument("max", type=grade_type)
+
+    stats = commands.add_parser("stats", help="статистика",
+                                parents=[output])
+    stats.add_argument("kind", choices=["groups", "subjects", "top"])
+    stats.add_argument("--limit", type=int, default=10)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    controller = Controller(Database(args.db))
+    try:
+        if args.command == "search":
+            return run_search(args, controller)
+        if args.command == "stats":
+            return run_stats(args, controller)
+        return run_file_command(
+            args, controller, print_progress if args.progress else None)
+    except BrokenPipeError:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    finally:
+        controller.db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
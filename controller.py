@@ -1,342 +1,500 @@
-from tkinter import *
-from tkinter import ttk, messagebox, filedialog
-import json
-import xml.sax
-from xml.sax.handler import ContentHandler
-from xml.dom import minidom
-from xml.dom.minidom import Document
-from model import Database
-import sqlite3
-import io
-import os
-
-
-class StudentHandler(xml.sax.ContentHandler):
-    def __init__(self):
-        self.students = []
-        self.current_student = None
-        self.current_tag = None
-        self.current_exam = None
-
-    def startElement(self, tag, attrs):
-
-        self.current_tag = tag
-        if tag == "student":
-            self.current_student = {"fio": "", "group": "", "exams": {}}
-        elif tag == "exam":
-            self.current_exam = attrs["subject"]
-
-    def characters(self, content):
-        if self.current_tag == "fio":
-            self.current_student["fio"] += content.strip()
-        elif self.current_tag == "group":
-            self.current_student["group"] += content.strip()
-        elif self.current_tag == "grade" and self.current_exam:
-            self.current_student["exams"][self.current_exam] = int(
-                content.strip())
-
-    def endElement(self, tag):
-        if tag == "student":
-            self.students.append(self.current_student)
-            self.current_student = None
-        self.current_tag = None
-        if tag == "exam":
-            self.current_exam = None
-
-
-class Controller:
-    LEN = 6
-
-    def __init__(self, db):
-        self.db = db
-        self.notes = self.db.get_all_students()
-
-    def get_total(self):
-        return self.db.get_total_items()
-
-    def get_paginated(self, limit, ofset):
-        return self.db.get_paginated_students(limit, ofset)
-
-    def clear_db(self):
-        try:
-            self.db.clear_db()
-            return True
-        except Exception as e:
-            return False
-
-    def find_path(self):
-        file_path = filedialog.askopenfilename(
-            filetypes=[("XML files", "*.xml")],
-            title="Выберите XML файл"
-        )
-        return file_path
-
-    def find_path_sql(self):
-        file_path = filedialog.askopenfilename(
-            filetypes=[("SQL files", "*.sql"), ("All files", "*.*")],
-            title="Выберите SQL файл для загрузки"
-        )
-        return file_path
-
-    def save_to_sql(self, file_path):
-        try:
-            with io.open(file_path, 'w', encoding='utf-8') as f:
-                for line in self.db.conn.iterdump():
-                    f.write('%s\n' % line)
-            return True
-        except Exception as e:
-            return False
-
-    def load_from_sql(self, file_path):
-        try:
-
-            with io.open(file_path, 'r', encoding='utf-8') as f:
-                sql_script = f.read()
-
-            temp_conn = sqlite3.connect(':memory:')
-            temp_cursor = temp_conn.cursor()
-
-            temp_cursor.executescript(sql_script)
-
-            temp_cursor.execute("SELECT * FROM students")
-            students = temp_cursor.fetchall()
-
-            temp_cursor.execute("SELECT * FROM exams")
-            exams = temp_cursor.fetchall()
-
-            self.db.cursor.execute("PRAGMA foreign_keys=OFF")
-
-            for student in students:
-
-                self.db.cursor.execute(
-                    "SELECT id FROM students WHERE id=?", (student[0],))
-                if not self.db.cursor.fetchone():
-                    self.db.cursor.execute(
-                        "INSERT INTO students (id, fio, group_name) VALUES (?, ?, ?)",
-                        student
-                    )
-
-            for exam in exams:
-                self.db.cursor.execute(
-                    "SELECT student_id FROM exams WHERE student_id=?",
-                    (exam[0],)
-                )
-                if not self.db.cursor.fetchone():
-                    self.db.cursor.execute(
-                        "INSERT INTO exams (student_id, exams_data) VALUES (?, ?)",
-                        exam
-                    )
-            self.db.cursor.execute("PRAGMA foreign_keys=ON")
-            self.db.conn.commit()
-            temp_conn.close()
-
-            return True
-        except Exception as e:
-            print(f"Ошибка при загрузке SQL-файла: {e}")
-            self.db.conn.rollback()
-            self.db.cursor.execute("PRAGMA foreign_keys=ON")
-            if 'temp_conn' in locals():
-                temp_conn.close()
-            return False
-
-    def load(self, file_path):
-        try:
-
-            handler = StudentHandler()
-            parser = xml.sax.make_parser()
-            parser.setContentHandler(handler)
-
-            parser.parse(file_path)
-
-            for student in handler.students:
-                self.db.add_student(
-                    student["fio"],
-                    student["group"],
-                    student["exams"]
-                )
-            return True
-        except Exception as e:
-            return False
-
-    def validate_student_data(self, data):
-        errors = []
-
-        if not all(c.isalpha() or c.isspace() for c in data['fio']):
-            errors.append("ФИО должно содержать только буквы и пробелы")
-        if len(data['fio'].strip()) < 5:
-            errors.append("ФИО слишком короткое (минимум 5 символов)")
-
-        if not data['group'].isdigit() or len(data['group']) != self.LEN:
-            errors.append(f"Номер группы должен состоять из {self.LEN} цифр")
-
-        if not isinstance(data['exams'], dict):
-            errors.append("Экзамены должны быть в формате словаря")
-        else:
-            for subject, grade in data['exams'].items():
-                if not isinstance(subject, str) or not all(
-                        c.isalpha() or c.isspace() for c in subject) or not subject.strip():
-                    errors.append(
-                        "Название предмета должно быть непустой строкой и содержать только буквы и пробелы")
-                if not isinstance(grade, int) or grade < 1 or grade > 10:
-                    errors.append(
-                        f"Оценка по {subject} должна быть целым числом от 1 до 10")
-
-        return errors
-
-    def create(self, student_data):
-        try:
-           
-            errors = self.validate_student_data(student_data)
-            if errors:
-                return errors
-
-            
-            self.db.add_student(
-                fio=student_data['fio'],
-                group=student_data['group'],
-                exams=student_data['exams']
-            )
-
-            
-
-            return True
-
-        except Exception as e:
-            return e
-
-    def search_by_group(self, group):
-        try:
-            errors = []
-            if not group or len(group) != self.LEN:
-                errors.append(
-                    f"Номер группы должен состоять из {
-                        self.LEN} цифр"
-                )
-            if not group.isdigit():
-                errors.append(f"Номер группы должен состоять из цифр")
-            if errors:
-                return str(errors)[1:-1]
-
-            students = self.db.get_all_students()
-            return [student for student in students if student['group'] == group]
-
-        except Exception as e:
-            return False
-
-    def search_by_avg_grade(self, ex, min, max):
-        try:
-            students = self.db.get_all_students()
-            result = []
-            errors = []
-            if not isinstance(ex, str) or not all(
-                    c.isalpha() or c.isspace() for c in ex) or not ex.strip():
-                errors.append(
-                    "Название предмета должно быть непустой строкой и содержать только буквы и пробелы")
-
-            if min < 1 or min > 10:
-                errors.append(
-                    f"Нижний Предел должен быть целым числом от 1 до 10")
-
-            if max < 1 or max > 10:
-                errors.append(
-                    f"Верхний Предел должен быть целым числом от 1 до 10")
-
-            if not max > min:
-                errors.append(f"Верхний предел  должен быть больше нижнего")
-            if errors:
-
-                return str(errors)[1:-1]
-
-            for student in students:
-                if ex in student['exams']:
-                    grades = list(student['exams'].values())
-                    avg_grade = sum(grades) / len(grades) if grades else 0
-                    if min <= avg_grade <= max:
-                        student['avg_grade'] = round(avg_grade, 2)
-                        result.append(student)
-            return result
-        except Exception as e:
-            return False
-
-    def search_by_exam_grade(self, ex, min, max):
-        try:
-            students = self.db.get_all_students()
-            result = []
-            errors = []
-            if not isinstance(ex, str) or not all(
-                    c.isalpha() or c.isspace() for c in ex) or not ex.strip():
-                errors.append(
-                    "Название предмета должно быть непустой строкой и содержать только буквы и пробелы")
-
-            if min < 1 or min > 10:
-                errors.append(f"Предел должен быть целым числом от 1 до 10")
-
-            if max < 1 or max > 10:
-                errors.append(f"Предел должен быть целым числом от 1 до 10")
-
-            if not max > min:
-                errors.append(f"Верхний предел  должен быть больше нижнего")
-
-            if errors:
-                return str(errors)[1:-1]
-
-            for student in students:
-                if ex in student['exams']:
-                    grade = student['exams'][ex]
-                    if min <= grade <= max:
-                        result.append(student)
-            return result
-
-        except Exception as e:
-            return False
-
-    def delete(self, results):
-        success = 0
-        failed = 0
-        for student in results:
-            try:
-                self.db.delete_student(student['id'])
-                success += 1
-            except Exception as e:
-                failed += 1
-        return success, failed
-
-    def save_to_xml(self, file_path):
-
-        try:
-            students = self.db.get_all_students()
-            doc = Document()
-            root = doc.createElement('students')
-            doc.appendChild(root)
-            for student in students:
-                student_elem = doc.createElement('student')
-                root.appendChild(student_elem)
-                fio_elem = doc.createElement('fio')
-                fio_elem.appendChild(doc.createTextNode(student['fio']))
-                student_elem.appendChild(fio_elem)
-
-                group_elem = doc.createElement('group')
-                group_elem.appendChild(doc.createTextNode(student['group']))
-                student_elem.appendChild(group_elem)
-
-                exams_elem = doc.createElement('exams')
-                student_elem.appendChild(exams_elem)
-
-                for subject, grade in student['exams'].items():
-                    exam_elem = doc.createElement('exam')
-                    exam_elem.setAttribute('subject', subject)
-
-                    grade_elem = doc.createElement('grade')
-                    grade_elem.appendChild(doc.createTextNode(str(grade)))
-                    exam_elem.appendChild(grade_elem)
-
-                    exams_elem.appendChild(exam_elem)
-
-            xml_str = doc.toprettyxml(indent="  ", encoding='utf-8')
-
-            with open(file_path, 'wb') as f:
-                f.write(xml_str)
-
-            return True
-        except Exception as e:
-            return False
+import json
+import xml.sax
+from xml.sax.handler import ContentHandler
+from xml.sax.saxutils import XMLGenerator
+from model import Database
+import sqlite3
+import io
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+
+
+class OperationCancelled(Exception):
+    pass
+
+
+class StudentHandler(xml.sax.ContentHandler):
+    def __init__(self, on_student=None):
+        self.students = []
+        self.on_student = on_student
+        self.current_student = None
+        self.current_tag = None
+        self.current_exam = None
+        self.text = ""
+
+    def startElement(self, tag, attrs):
+
+        self.current_tag = tag
+        self.text = ""
+        if tag == "student":
+            self.current_student = {"fio": "", "group": "", "exams": {}}
+        elif tag == "exam":
+            self.current_exam = attrs["subject"]
+
+    def characters(self, content):
+        if self.current_tag in ("fio", "group", "grade"):
+            self.text += content
+
+    def endElement(self, tag):
+        if tag == "fio":
+            self.current_student["fio"] += self.text.strip()
+        elif tag == "group":
+            self.current_student["group"] += self.text.strip()
+        elif tag == "grade" and self.current_exam:
+            self.current_student["exams"][self.current_exam] = int(
+                self.text.strip())
+        elif tag == "student":
+            if self.on_student:
+                self.on_student(self.current_student)
+            else:
+                self.students.append(self.current_student)
+            self.current_student = None
+        self.current_tag = None
+        self.text = ""
+        if tag == "exam":
+            self.current_exam = None
+
+
+class StudentBatchWriter:
+    def __init__(self, db, batch_size=1000):
+        self.db = db
+        self.batch_size = batch_size
+        self.batch = []
+        self.total = 0
+        self.id_ranges = []
+
+    def add(self, student):
+        self.batch.append(student)
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.batch:
+            self.total += self.db.add_students_bulk(
+                self.batch, self.batch_size, id_ranges=self.id_ranges)
+            self.batch = []
+
+
+class StudentXMLWriter:
+    def __init__(self, stream, pretty=True, indent="  "):
+        self.generator = XMLGenerator(
+            stream, encoding='utf-8', short_empty_elements=True)
+        self.pretty = pretty
+        self.indent = indent
+
+    def newline(self, level):
+        if self.pretty:
+            self.generator.ignorableWhitespace("\n" + self.indent * level)
+
+    def text_element(self, tag, text, level):
+        self.newline(level)
+        self.generator.startElement(tag, {})
+        self.generator.characters(text)
+        self.generator.endElement(tag)
+
+    def start(self):
+        self.generator.startDocument()
+        self.generator.startElement('students', {})
+
+    def write_student(self, student):
+        self.newline(1)
+        self.generator.startElement('student', {})
+        self.text_element('fio', student['fio'], 2)
+        self.text_element('group', student['group'], 2)
+
+        self.newline(2)
+        self.generator.startElement('exams', {})
+        for subject, grade in student['exams'].items():
+            self.newline(3)
+            self.generator.startElement('exam', {'subject': subject})
+            self.text_element('grade', str(grade), 4)
+            self.newline(3)
+            self.generator.endElement('exam')
+        if student['exams']:
+            self.newline(2)
+        self.generator.endElement('exams')
+
+        self.newline(1)
+        self.generator.endElement('student')
+
+    def end(self):
+        self.newline(0)
+        self.generator.endElement('students')
+        self.newline(0)
+        self.generator.endDocument()
+
+
+class QueryCache:
+    def __init__(self, size):
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.data_version = 0
+
+    def get(self, key, query, *args):
+        with self.lock:
+            version = self.data_version
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+        result = query(*args)
+        with self.lock:
+            if version == self.data_version:
+                self.entries[key] = result
+                if len(self.entries) > self.size:
+                    self.entries.popitem(last=False)
+        return result
+
+    def invalidate(self):
+        with self.lock:
+            self.data_version += 1
+            self.entries.clear()
+
+
+class Controller:
+    LEN = 6
+    READ_BLOCK_SIZE = 64 * 1024
+    PROGRESS_STEP = 1000
+    DUMP_SKIP_PREFIXES = (
+        "PRAGMA writable_schema",
+        "INSERT INTO sqlite_master",
+        "CREATE TABLE 'students_fts",
+        "INSERT INTO \"students_fts",
+        "CREATE TRIGGER students_fts",
+    )
+    CACHE_SIZE = 256
+
+    def __init__(self, db, cache_size=CACHE_SIZE, cache=None):
+        self.db = db
+        self.cache = cache if cache is not None else QueryCache(cache_size)
+        self.instrumentation = None
+
+    def cached(self, key, query, *args):
+        return self.cache.get(key, query, *args)
+
+    def invalidate_cache(self):
+        self.cache.invalidate()
+
+    def spawn(self):
+        controller = Controller(Database(self.db.db_name), cache=self.cache)
+        if self.instrumentation is not None:
+            self.instrumentation.attach(controller)
+        return controller
+
+    def get_total(self):
+        return self.cached(("total",), self.db.get_total_items)
+
+    def get_paginated(self, limit, ofset):
+        return self.cached(
+            ("page", limit, ofset),
+            self.db.get_paginated_students, limit, ofset)
+
+    def get_paginated_after(self, limit, after_id):
+        return self.cached(
+            ("after", limit, after_id),
+            self.db.get_students_after, after_id, limit)
+
+    def get_paginated_before(self, limit, before_id):
+        return self.cached(
+            ("before", limit, before_id),
+            self.db.get_students_before, before_id, limit)
+
+    def get_page_boundaries(self, limit):
+        return self.cached(
+            ("boundaries", limit), self.db.get_page_boundaries, limit)
+
+    def clear_db(self):
+        try:
+            self.db.clear_db()
+            return True
+        except Exception as e:
+            return False
+        finally:
+            self.invalidate_cache()
+
+    def snapshot_progress(self, progress):
+        if progress is None:
+            return None
+        return lambda status, remaining, total: progress(
+            total - remaining, total)
+
+    def save_snapshot(self, file_path, progress=None, pages=1024):
+        try:
+            self.db.backup_to(file_path, pages=pages,
+                              progress=self.snapshot_progress(progress))
+            return True
+        except Exception as e:
+            return False
+
+    def load_snapshot(self, file_path, progress=None, pages=1024):
+        try:
+            self.db.restore_from(file_path, pages=pages,
+                                 progress=self.snapshot_progress(progress))
+            return True
+        except Exception as e:
+            return False
+        finally:
+            self.invalidate_cache()
+
+    @contextmanager
+    def atomic_output(self, file_path, mode, **kwargs):
+        temp_path = file_path + ".tmp"
+        try:
+            with io.open(temp_path, mode, **kwargs) as f:
+                yield f
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def save_to_sql(self, file_path, progress=None):
+        try:
+            with self.atomic_output(file_path, 'w', encoding='utf-8') as f:
+                for count, line in enumerate(self.db.conn.iterdump(), 1):
+                    if line.startswith(self.DUMP_SKIP_PREFIXES):
+                        continue
+                    f.write('%s\n' % line)
+                    if progress and count % self.PROGRESS_STEP == 0:
+                        progress(count, 0)
+            return True
+        except Exception as e:
+            return False
+
+    def load_from_sql(self, file_path, progress=None):
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(suffix='.db')
+            os.close(fd)
+
+            temp_conn = sqlite3.connect(temp_path, autocommit=True)
+            try:
+                temp_conn.execute("PRAGMA journal_mode = OFF")
+                temp_conn.execute("PRAGMA synchronous = OFF")
+                total = os.path.getsize(file_path)
+                with open(file_path, 'rb') as f:
+                    for statement in self.read_sql_statements(
+                            f, progress, total):
+                        temp_conn.executescript(statement)
+            finally:
+                temp_conn.close()
+
+            self.db.merge_database(temp_path)
+            return True
+        except Exception as e:
+            print(f"Ошибка при загрузке SQL-файла: {e}", file=sys.stderr)
+            return False
+        finally:
+            self.invalidate_cache()
+            if temp_path:
+                os.remove(temp_path)
+
+    def read_sql_statements(self, f, progress=None, total=0):
+        statement = ""
+        done = 0
+        for count, line in enumerate(f, 1):
+            done += len(line)
+            statement += line.decode('utf-8')
+            if len(statement) >= self.READ_BLOCK_SIZE and \
+                    sqlite3.complete_statement(statement):
+                yield statement
+                statement = ""
+            if progress and count % self.PROGRESS_STEP == 0:
+                progress(done, total)
+        if statement.strip():
+            yield statement
+
+    def load(self, file_path, progress=None, fast=False):
+        writer = StudentBatchWriter(self.db)
+        try:
+            with self.db.fast_import() if fast else nullcontext():
+                handler = StudentHandler(writer.add)
+                parser = xml.sax.make_parser()
+                parser.setContentHandler(handler)
+
+                total = os.path.getsize(file_path)
+                with open(file_path, 'rb') as f:
+                    for block in iter(
+                            lambda: f.read(self.READ_BLOCK_SIZE), b''):
+                        parser.feed(block)
+                        if progress:
+                            progress(f.tell(), total)
+                parser.close()
+                writer.flush()
+            return True
+        except Exception as e:
+            self.db.delete_student_ranges(writer.id_ranges)
+            return False
+        finally:
+            self.invalidate_cache()
+
+    def validate_student_data(self, data):
+        errors = []
+
+        if not all(c.isalpha() or c.isspace() for c in data['fio']):
+            errors.append("ФИО должно содержать только буквы и пробелы")
+        if len(data['fio'].strip()) < 5:
+            errors.append("ФИО слишком короткое (минимум 5 символов)")
+
+        if not data['group'].isdigit() or len(data['group']) != self.LEN:
+            errors.append(f"Номер группы должен состоять из {self.LEN} цифр")
+
+        if not isinstance(data['exams'], dict):
+            errors.append("Экзамены должны быть в формате словаря")
+        else:
+            for subject, grade in data['exams'].items():
+                if not isinstance(subject, str) or not all(
+                        c.isalpha() or c.isspace() for c in subject) or not subject.strip():
+                    errors.append(
+                        "Название предмета должно быть непустой строкой и содержать только буквы и пробелы")
+                if not isinstance(grade, int) or grade < 1 or grade > 10:
+                    errors.append(
+                        f"Оценка по {subject} должна быть целым числом от 1 до 10")
+
+        return errors
+
+    def create(self, student_data):
+        try:
+           
+            errors = self.validate_student_data(student_data)
+            if errors:
+                return errors
+
+            
+            self.db.add_student(
+                fio=student_data['fio'],
+                group=student_data['group'],
+                exams=student_data['exams']
+            )
+            self.invalidate_cache()
+
+            
+
+            return True
+
+        except Exception as e:
+            return e
+
+    def search_by_group(self, group):
+        try:
+            errors = []
+            if not group or len(group) != self.LEN:
+                errors.append(
+                    f"Номер группы должен состоять из {
+                        self.LEN} цифр"
+                )
+            if not group.isdigit():
+                errors.append(f"Номер группы должен состоять из цифр")
+            if errors:
+                return str(errors)[1:-1]
+
+            return self.cached(("group", group), self.db.find_by_group, group)
+
+        except Exception as e:
+            return False
+
+    def search_by_fio(self, fio):
+        try:
+            if not fio.strip() or not all(
+                    c.isalpha() or c.isspace() for c in fio):
+                return "ФИО должно содержать только буквы и пробелы"
+
+            return self.cached(("fio", fio), self.db.find_by_fio, fio)
+
+        except Exception as e:
+            return False
+
+    def search_by_avg_grade(self, ex, min, max):
+        try:
+            errors = []
+            if not isinstance(ex, str) or not all(
+                    c.isalpha() or c.isspace() for c in ex) or not ex.strip():
+                errors.append(
+                    "Название предмета должно быть непустой строкой и содержать только буквы и пробелы")
+
+            if min < 1 or min > 10:
+                errors.append(
+                    f"Нижний Предел должен быть целым числом от 1 до 10")
+
+            if max < 1 or max > 10:
+                errors.append(
+                    f"Верхний Предел должен быть целым числом от 1 до 10")
+
+            if not max > min:
+                errors.append(f"Верхний предел  должен быть больше нижнего")
+            if errors:
+
+                return str(errors)[1:-1]
+
+            return self.cached(
+                ("avg_grade", ex, min, max),
+                self.db.find_by_avg_grade, ex, min, max)
+        except Exception as e:
+            return False
+
+    def search_by_exam_grade(self, ex, min, max):
+        try:
+            errors = []
+            if not isinstance(ex, str) or not all(
+                    c.isalpha() or c.isspace() for c in ex) or not ex.strip():
+                errors.append(
+                    "Название предмета должно быть непустой строкой и содержать только буквы и пробелы")
+
+            if min < 1 or min > 10:
+                errors.append(f"Предел должен быть целым числом от 1 до 10")
+
+            if max < 1 or max > 10:
+                errors.append(f"Предел должен быть целым числом от 1 до 10")
+
+            if not max > min:
+                errors.append(f"Верхний предел  должен быть больше нижнего")
+
+            if errors:
+                return str(errors)[1:-1]
+
+            return self.cached(
+                ("exam_grade", ex, min, max),
+                self.db.find_by_exam_grade, ex, min, max)
+
+        except Exception as e:
+            return False
+
+    def get_group_stats(self):
+        return self.cached(("group_stats",), self.db.get_group_stats)
+
+    def get_subject_stats(self):
+        return self.cached(("subject_stats",), self.db.get_subject_stats)
+
+    def get_top_students(self, limit=10):
+        return self.cached(
+            ("top_students", limit), self.db.get_top_students, limit)
+
+    def delete(self, results):
+        student_ids = {student['id'] for student in results}
+        try:
+            success = self.db.delete_students(student_ids)
+        except Exception as e:
+            success = 0
+        finally:
+            self.invalidate_cache()
+        return success, len(student_ids) - success
+
+    def save_to_xml(self, file_path, pretty=True, progress=None):
+        try:
+            total = self.db.get_total_items() if progress else 0
+            with self.atomic_output(file_path, 'wb') as f:
+                writer = StudentXMLWriter(f, pretty=pretty)
+                writer.start()
+                f.flush()
+                for count, student in enumerate(self.db.iter_students(), 1):
+                    writer.write_student(student)
+                    if progress and count % self.PROGRESS_STEP == 0:
+                        progress(count, total)
+                writer.end()
+            return True
+        except Exception as e:
+            return False
\ No newline at end of file
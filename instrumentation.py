@@ -0,0 +1,284 @@
+import bisect
+import csv
+import functools
+import inspect
+import json
+import os
+import re
+import threading
+import time
+
+
+class CallStats:
+    BUCKETS = [0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5]
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.histogram = [0] * (len(self.BUCKETS) + 1)
+
+    def add(self, seconds, rows=None, nbytes=None):
+        self.calls += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.histogram[bisect.bisect_left(self.BUCKETS, seconds)] += 1
+        if rows:
+            self.rows += rows
+        if nbytes:
+            self.bytes += nbytes
+
+    def percentile(self, fraction):
+        target = self.calls * fraction
+        seen = 0
+        for bound, count in zip(self.BUCKETS + [self.max], self.histogram):
+            seen += count
+            if count and seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "total": self.total,
+            "avg": self.total / self.calls if self.calls else 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": self.max,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "histogram": dict(zip(
+                [f"<={bound}" for bound in self.BUCKETS] + ["inf"],
+                self.histogram)),
+        }
+
+
+class TracedCursor:
+    def __init__(self, cursor, instrumentation):
+        self.cursor = cursor
+        self.instrumentation = instrumentation
+        self.pending = None
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            row = next(self.cursor)
+        except StopIteration:
+            self.add_time(start)
+            self.finish()
+            raise
+        self.add_time(start, 1)
+        return row
+
+    def execute(self, sql, parameters=()):
+        return self.run(self.cursor.execute, sql, parameters)
+
+    def executemany(self, sql, parameters):
+        return self.run(self.cursor.executemany, sql, parameters)
+
+    def run(self, method, sql, parameters):
+        self.finish()
+        self.instrumentation.local.text = None
+        self.instrumentation.local.prefix = sql.split("?", 1)[0]
+        start = time.perf_counter()
+        try:
+            method(sql, parameters)
+        except Exception:
+            self.open_statement(sql, start)
+            self.finish()
+            raise
+        self.open_statement(sql, start)
+        if self.cursor.description is None:
+            self.pending[2] = max(self.cursor.rowcount, 0)
+            self.finish()
+        return self
+
+    def open_statement(self, sql, start):
+        text = self.instrumentation.local.text or sql
+        self.instrumentation.local.prefix = None
+        self.pending = [text, time.perf_counter() - start, 0]
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = self.cursor.fetchone()
+        self.add_time(start, 0 if row is None else 1)
+        if row is None:
+            self.finish()
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = self.cursor.fetchmany(
+            self.cursor.arraysize if size is None else size)
+        self.add_time(start, len(rows))
+        if not rows:
+            self.finish()
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = self.cursor.fetchall()
+        self.add_time(start, len(rows))
+        self.finish()
+        return rows
+
+    def add_time(self, start, rows=0):
+        if self.pending is not None:
+            self.pending[1] += time.perf_counter() - start
+            self.pending[2] += rows
+
+    def finish(self):
+        if self.pending is None:
+            return
+        text, seconds, rows = self.pending
+        self.pending = None
+        self.instrumentation.record(
+            "sql", self.instrumentation.statement_key(text), seconds, rows,
+            len(text))
+
+    def close(self):
+        self.finish()
+        self.cursor.close()
+
+
+class Instrumentation:
+    FLUSH_INTERVAL = 10
+    SQL_KEY_LENGTH = 120
+    CONTROLLER_METHODS = [
+        "get_total", "get_paginated", "get_paginated_after",
+        "get_paginated_before", "get_page_boundaries", "clear_db",
+        "save_snapshot", "load_snapshot", "save_to_sql", "load_from_sql",
+        "load", "save_to_xml", "create", "delete",
+        "search_by_group", "search_by_fio", "search_by_avg_grade",
+        "search_by_exam_grade",
+        "get_group_stats", "get_subject_stats", "get_top_students",
+    ]
+    SQL_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+    SQL_SPACES = re.compile(r"\s+")
+    CSV_FIELDS = ["kind", "name", "calls", "total", "avg", "p50", "p95",
+                  "max", "rows", "bytes"]
+
+    def __init__(self, path=None, interval=FLUSH_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.stats = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.stopped = threading.Event()
+        self.flusher = None
+
+    def record(self, kind, name, seconds, rows=None, nbytes=None):
+        with self.lock:
+            stats = self.stats.get((kind, name))
+            if stats is None:
+                stats = self.stats[(kind, name)] = CallStats()
+            stats.add(seconds, rows, nbytes)
+
+    def attach(self, controller):
+        controller.instrumentation = self
+        for name in self.CONTROLLER_METHODS:
+            method = getattr(type(controller), name)
+            setattr(controller, name, self.wrap(controller, name, method))
+        self.trace_database(controller.db)
+        return controller
+
+    def wrap(self, controller, name, method):
+        bound = getattr(controller, name)
+        parameters = list(inspect.signature(method).parameters)
+        path_index = (parameters.index("file_path") - 1
+                      if "file_path" in parameters else None)
+
+        @functools.wraps(bound)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return_value = bound(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                if isinstance(controller.db.cursor, TracedCursor):
+                    controller.db.cursor.finish()
+            rows = len(return_value) if isinstance(
+                return_value, (list, dict)) else None
+            nbytes = None
+            if path_index is not None:
+                path = kwargs.get("file_path", args[path_index]
+                                  if len(args) > path_index else None)
+                if path and os.path.exists(path):
+                    nbytes = os.path.getsize(path)
+            self.record("controller", name, elapsed, rows, nbytes)
+            return return_value
+        return wrapper
+
+    def trace_database(self, db):
+        conn = db.conn
+
+        def trace(statement):
+            prefix = getattr(self.local, "prefix", None)
+            if prefix and self.local.text is None and \
+                    statement.startswith(prefix):
+                self.local.text = statement
+        conn.set_trace_callback(trace)
+        db.cursor = TracedCursor(db.cursor, self)
+        db.open_cursor = lambda: TracedCursor(conn.cursor(), self)
+
+    def statement_key(self, statement):
+        key = self.SQL_SPACES.sub(
+            " ", self.SQL_LITERALS.sub("?", statement)).strip()
+        return key[:self.SQL_KEY_LENGTH]
+
+    def snapshot(self):
+        with self.lock:
+            items = [(kind, name, stats.to_dict())
+                     for (kind, name), stats in self.stats.items()]
+        return sorted(items, key=lambda item: item[2]["total"], reverse=True)
+
+    def flush(self, path=None):
+        path = path or self.path
+        if not path:
+            return False
+        try:
+            temp_path = path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+                if path.endswith(".csv"):
+                    writer = csv.DictWriter(
+                        f, fieldnames=self.CSV_FIELDS, extrasaction='ignore')
+                    writer.writeheader()
+                    for kind, name, stats in self.snapshot():
+                        writer.writerow(dict(stats, kind=kind, name=name))
+                else:
+                    json.dump({
+                        "updated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                        "stats": [dict(stats, kind=kind, name=name)
+                                  for kind, name, stats in self.snapshot()],
+                    }, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, path)
+            return True
+        except Exception as e:
+            return False
+
+    def start(self):
+        if self.path and self.flusher is None:
+            self.flusher = threading.Thread(target=self.run_flusher,
+                                            daemon=True)
+            self.flusher.start()
+        return self
+
+    def run_flusher(self):
+        while not self.stopped.wait(self.interval):
+            self.flush()
+
+    def stop(self):
+        self.stopped.set()
+        self.flush()
+
+    def reset(self):
+        with self.lock:
+            self.stats.clear()
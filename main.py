@@ -1,9 +1,30 @@
-from controller import Controller
-from model import Database
-from view import *
-
-if __name__ == "__main__":
-    database=Database()
-    controller=Controller(database)
-    viewer=Main(controller)
+import argparse
+import os
+from controller import Controller
+from model import Database
+from instrumentation import Instrumentation
+from profiling import Profiler
+from view import *
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser()
+    parser.add_argument("--profile", metavar="DIR",
+                        default=os.environ.get("STUDENTS_PROFILE"),
+                        help="каталог для профилей операций")
+    args=parser.parse_args()
+    if args.profile:
+        profiler=Profiler(args.profile).start()
+        profiler.instrument(Controller)
+        profiler.instrument(Main, {"update_view": "page_render"})
+    database=Database()
+    controller=Controller(database)
+    stats_path=os.environ.get("STUDENTS_STATS")
+    if stats_path:
+        instrumentation=Instrumentation(stats_path).start()
+        instrumentation.attach(controller)
+    viewer=Main(controller)
+    if stats_path:
+        instrumentation.stop()
+    if args.profile:
+        profiler.stop()
     
\ No newline at end of file
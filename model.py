@@ -1,95 +1,597 @@
-import sqlite3
-import json
-
-class Database:
-    def __init__(self, db_name="students.db"):
-        self.conn = sqlite3.connect(db_name)
-        self.cursor = self.conn.cursor()
-        self.create_db()
-
-    def __del__(self):
-        self.conn.close()
-
-    def create_db(self):
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS students (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                fio TEXT NOT NULL,
-                group_name TEXT NOT NULL
-            )
-        ''')
-        
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS exams (
-                student_id INTEGER,
-                exams_data TEXT NOT NULL,
-                FOREIGN KEY (student_id) REFERENCES students(id)
-            )
-        ''')
-        self.conn.commit()
-
-    def add_student(self, fio, group, exams):
-        self.cursor.execute('''
-            INSERT INTO students (fio, group_name)
-            VALUES (?, ?)
-        ''', (fio, group))
-        student_id = self.cursor.lastrowid
-        
-        self.cursor.execute('''
-            INSERT INTO exams (student_id, exams_data)
-            VALUES (?, ?)
-        ''', (student_id, json.dumps(exams)))
-        
-        self.conn.commit()
-
-    def get_all_students(self):
-        self.cursor.execute('''
-            SELECT s.id, s.fio, s.group_name, e.exams_data 
-            FROM students s
-            JOIN exams e ON s.id = e.student_id
-        ''')
-        students = []
-        for row in self.cursor.fetchall():
-            students.append({
-                "id": row[0],
-                "fio": row[1],
-                "group": row[2],
-                "exams": json.loads(row[3])
-            })
-        return students
-
-    def delete_student(self, student_id):
-        self.cursor.execute('DELETE FROM exams WHERE student_id = ?', (student_id,))
-        self.cursor.execute('DELETE FROM students WHERE id = ?', (student_id,))
-        self.conn.commit()
-
-    def clear_db(self):
-        self.cursor.execute("DELETE FROM exams")
-        self.cursor.execute("DELETE FROM students")
-        self.conn.commit()
-
-    def get_total_students(self):
-        self.cursor.execute("SELECT COUNT(*) FROM students")
-        return self.cursor.fetchone()[0]
-
-    def get_paginated_students(self, limit, offset):
-        self.cursor.execute('''
-            SELECT s.id, s.fio, s.group_name, e.exams_data 
-            FROM students s
-            JOIN exams e ON s.id = e.student_id
-            LIMIT ? OFFSET ?
-        ''', (limit, offset))
-        
-        students = []
-        for row in self.cursor.fetchall():
-            students.append({
-                "id": row[0],
-                "fio": row[1],
-                "group": row[2],
-                "exams": json.loads(row[3])
-            })
-        return students
-    
-    def get_total_items(self):
-        self.cursor.execute("SELECT COUNT(*) FROM students")
+import sqlite3
+import json
+from contextlib import contextmanager
+
+class Database:
+    SCHEMA_VERSION = 4
+    FTS_DELETE_TRIGGER = '''
+        CREATE TRIGGER IF NOT EXISTS students_fts_delete
+        AFTER DELETE ON students BEGIN
+            INSERT INTO students_fts (students_fts, rowid, fio)
+            VALUES ('delete', old.id, old.fio);
+        END
+    '''
+    MAX_IN_PARAMS = 500
+
+    def __init__(self, db_name="students.db"):
+        self.db_name = db_name
+        self.conn = sqlite3.connect(db_name)
+        self.cursor = self.conn.cursor()
+        self.create_db()
+
+    def __del__(self):
+        self.close()
+
+    def open_cursor(self):
+        return self.conn.cursor()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def interrupt(self):
+        if self.conn is not None:
+            self.conn.interrupt()
+
+    def create_db(self):
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS students (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                fio TEXT NOT NULL,
+                group_name TEXT NOT NULL,
+                avg_grade REAL,
+                exam_count INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS exams (
+                student_id INTEGER,
+                exams_data TEXT NOT NULL,
+                FOREIGN KEY (student_id) REFERENCES students(id)
+            )
+        ''')
+
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS grades (
+                student_id INTEGER NOT NULL,
+                subject TEXT NOT NULL,
+                grade INTEGER NOT NULL,
+                FOREIGN KEY (student_id) REFERENCES students(id)
+            )
+        ''')
+
+        self.cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS students_fts USING fts5 (
+                fio,
+                content='students',
+                content_rowid='id'
+            )
+        ''')
+        self.cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS students_fts_insert
+            AFTER INSERT ON students BEGIN
+                INSERT INTO students_fts (rowid, fio)
+                VALUES (new.id, new.fio);
+            END
+        ''')
+        self.cursor.execute(self.FTS_DELETE_TRIGGER)
+        self.cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS students_fts_update
+            AFTER UPDATE OF fio ON students BEGIN
+                INSERT INTO students_fts (students_fts, rowid, fio)
+                VALUES ('delete', old.id, old.fio);
+                INSERT INTO students_fts (rowid, fio)
+                VALUES (new.id, new.fio);
+            END
+        ''')
+
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_exams_student
+            ON exams (student_id)
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_grades_subject_grade
+            ON grades (subject, grade)
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_grades_student
+            ON grades (student_id)
+        ''')
+        self.conn.commit()
+
+        self.cursor.execute("PRAGMA user_version")
+        version = self.cursor.fetchone()[0]
+        if version < 1:
+            self.migrate_grades()
+        if version < 2:
+            self.migrate_averages()
+        if version < 3:
+            self.cursor.execute(
+                "INSERT INTO students_fts (students_fts) VALUES ('rebuild')")
+        if version < 4:
+            self.cursor.execute("DROP INDEX IF EXISTS idx_students_group")
+        if version < self.SCHEMA_VERSION:
+            self.cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self.conn.commit()
+
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_students_avg
+            ON students (avg_grade)
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_students_group_stats
+            ON students (group_name, exam_count, avg_grade)
+        ''')
+        self.conn.commit()
+
+    def migrate_grades(self):
+        self.cursor.execute('''
+            INSERT INTO grades (student_id, subject, grade)
+            SELECT e.student_id, j.key, j.value
+            FROM exams e, json_each(e.exams_data) j
+            WHERE NOT EXISTS (
+                SELECT 1 FROM grades g WHERE g.student_id = e.student_id
+            )
+        ''')
+
+    def migrate_averages(self):
+        self.cursor.execute("PRAGMA table_info(students)")
+        columns = {row[1] for row in self.cursor.fetchall()}
+        if "avg_grade" not in columns:
+            self.cursor.execute(
+                "ALTER TABLE students ADD COLUMN avg_grade REAL")
+        if "exam_count" not in columns:
+            self.cursor.execute(
+                "ALTER TABLE students "
+                "ADD COLUMN exam_count INTEGER NOT NULL DEFAULT 0")
+        self.update_averages()
+
+    def update_averages(self):
+        self.cursor.execute('''
+            UPDATE students
+            SET avg_grade = (
+                    SELECT AVG(g.grade) FROM grades g
+                    WHERE g.student_id = students.id),
+                exam_count = (
+                    SELECT COUNT(*) FROM grades g
+                    WHERE g.student_id = students.id)
+            WHERE avg_grade IS NULL
+        ''')
+
+    def merge_database(self, path):
+        self.conn.commit()
+        self.cursor.execute("ATTACH DATABASE ? AS source", (path,))
+        try:
+            self.cursor.execute('''
+                INSERT OR IGNORE INTO students (id, fio, group_name)
+                SELECT id, fio, group_name FROM source.students
+            ''')
+            self.cursor.execute('''
+                INSERT INTO exams (student_id, exams_data)
+                SELECT se.student_id, se.exams_data
+                FROM source.exams se
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM exams e WHERE e.student_id = se.student_id
+                )
+            ''')
+            self.migrate_grades()
+            self.update_averages()
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self.cursor.execute("DETACH DATABASE source")
+
+    def add_student(self, fio, group, exams):
+        self.cursor.execute('''
+            INSERT INTO students (fio, group_name, avg_grade, exam_count)
+            VALUES (?, ?, ?, ?)
+        ''', (fio, group, self.average(exams), len(exams)))
+        student_id = self.cursor.lastrowid
+        
+        self.cursor.execute('''
+            INSERT INTO exams (student_id, exams_data)
+            VALUES (?, ?)
+        ''', (student_id, json.dumps(exams)))
+
+        self.cursor.executemany('''
+            INSERT INTO grades (student_id, subject, grade)
+            VALUES (?, ?, ?)
+        ''', [(student_id, subject, grade) for subject, grade in exams.items()])
+        
+        self.conn.commit()
+
+    def add_students_bulk(self, students, chunk_size=1000, fast=False,
+                          id_ranges=None):
+        if fast:
+            with self.fast_import():
+                return self.add_students_bulk(
+                    students, chunk_size, id_ranges=id_ranges)
+
+        total = 0
+        chunk = []
+        for student in students:
+            chunk.append(student)
+            if len(chunk) >= chunk_size:
+                total += self.insert_students_chunk(chunk, id_ranges)
+                chunk = []
+        if chunk:
+            total += self.insert_students_chunk(chunk, id_ranges)
+        return total
+
+    def insert_students_chunk(self, students, id_ranges=None):
+        self.conn.commit()
+        try:
+            self.cursor.execute("BEGIN IMMEDIATE")
+            first_id = self.get_next_student_id()
+            student_rows = []
+            exam_rows = []
+            grade_rows = []
+            for student_id, student in enumerate(students, start=first_id):
+                student_rows.append((
+                    student_id, student["fio"], student["group"],
+                    self.average(student["exams"]), len(student["exams"])))
+                exam_rows.append((student_id, json.dumps(student["exams"])))
+                for subject, grade in student["exams"].items():
+                    grade_rows.append((student_id, subject, grade))
+
+            self.cursor.executemany('''
+                INSERT INTO students (id, fio, group_name, avg_grade,
+                                      exam_count)
+                VALUES (?, ?, ?, ?, ?)
+            ''', student_rows)
+            self.cursor.executemany('''
+                INSERT INTO exams (student_id, exams_data)
+                VALUES (?, ?)
+            ''', exam_rows)
+            self.cursor.executemany('''
+                INSERT INTO grades (student_id, subject, grade)
+                VALUES (?, ?, ?)
+            ''', grade_rows)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        if id_ranges is not None:
+            id_ranges.append((first_id, first_id + len(students) - 1))
+        return len(students)
+
+    def average(self, exams):
+        if not exams:
+            return None
+        return sum(exams.values()) / len(exams)
+
+    def get_next_student_id(self):
+        self.cursor.execute('''
+            SELECT MAX(
+                COALESCE((SELECT seq FROM sqlite_sequence
+                          WHERE name = 'students'), 0),
+                COALESCE((SELECT MAX(id) FROM students), 0)
+            ) + 1
+        ''')
+        return self.cursor.fetchone()[0]
+
+    @contextmanager
+    def fast_import(self):
+        self.conn.commit()
+        self.cursor.execute("PRAGMA journal_mode")
+        journal_mode = self.cursor.fetchone()[0]
+        self.cursor.execute("PRAGMA synchronous")
+        synchronous = self.cursor.fetchone()[0]
+        self.cursor.execute("PRAGMA journal_mode = MEMORY")
+        self.cursor.execute("PRAGMA synchronous = OFF")
+        try:
+            yield
+        finally:
+            if self.conn.in_transaction:
+                self.conn.rollback()
+            self.cursor.execute(f"PRAGMA journal_mode = {journal_mode}")
+            self.cursor.execute(f"PRAGMA synchronous = {synchronous}")
+
+    def backup_to(self, path, pages=1024, progress=None):
+        self.conn.commit()
+        target = sqlite3.connect(path)
+        try:
+            self.conn.backup(target, pages=pages, progress=progress)
+        finally:
+            target.close()
+
+    def restore_from(self, path, pages=1024, progress=None):
+        self.conn.commit()
+        source = sqlite3.connect(path)
+        try:
+            source.backup(self.conn, pages=pages, progress=progress)
+        finally:
+            source.close()
+        self.create_db()
+
+    def get_all_students(self):
+        self.cursor.execute('''
+            SELECT s.id, s.fio, s.group_name, e.exams_data 
+            FROM students s
+            JOIN exams e ON s.id = e.student_id
+        ''')
+        return self.fetch_students()
+
+    def iter_students(self):
+        cursor = self.open_cursor()
+        try:
+            cursor.execute('''
+                SELECT s.id, s.fio, s.group_name, e.exams_data
+                FROM students s
+                JOIN exams e ON s.id = e.student_id
+                ORDER BY s.id
+            ''')
+            for row in cursor:
+                yield {
+                    "id": row[0],
+                    "fio": row[1],
+                    "group": row[2],
+                    "exams": json.loads(row[3])
+                }
+        finally:
+            cursor.close()
+
+    def fetch_students(self):
+        students = []
+        for row in self.cursor.fetchall():
+            students.append({
+                "id": row[0],
+                "fio": row[1],
+                "group": row[2],
+                "exams": json.loads(row[3])
+            })
+        return students
+
+    def find_by_group(self, group):
+        self.cursor.execute('''
+            SELECT s.id, s.fio, s.group_name, e.exams_data
+            FROM students s
+            JOIN exams e ON s.id = e.student_id
+            WHERE s.group_name = ?
+        ''', (group,))
+        return self.fetch_students()
+
+    def find_by_fio(self, query):
+        self.cursor.execute('''
+            SELECT s.id, s.fio, s.group_name, e.exams_data
+            FROM students_fts f
+            JOIN students s ON s.id = f.rowid
+            JOIN exams e ON s.id = e.student_id
+            WHERE students_fts MATCH ?
+        ''', (self.fio_match_expression(query),))
+        return self.fetch_students()
+
+    def fio_match_expression(self, query):
+        tokens = query.replace('"', ' ').split()
+        return " ".join(f'"{token}"*' for token in tokens)
+
+    def find_by_exam_grade(self, subject, min_grade, max_grade):
+        self.cursor.execute('''
+            SELECT s.id, s.fio, s.group_name, e.exams_data
+            FROM grades g
+            JOIN students s ON s.id = g.student_id
+            JOIN exams e ON s.id = e.student_id
+            WHERE g.subject = ? AND g.grade BETWEEN ? AND ?
+        ''', (subject, min_grade, max_grade))
+        return self.fetch_students()
+
+    def find_by_avg_grade(self, subject, min_avg, max_avg):
+        self.cursor.execute('''
+            SELECT s.id, s.fio, s.group_name, e.exams_data, s.avg_grade
+            FROM students s
+            JOIN exams e ON s.id = e.student_id
+            WHERE s.avg_grade BETWEEN ? AND ?
+            AND EXISTS (
+                SELECT 1 FROM grades g
+                WHERE g.student_id = s.id AND g.subject = ?
+            )
+        ''', (min_avg, max_avg, subject))
+        students = []
+        for row in self.cursor.fetchall():
+            students.append({
+                "id": row[0],
+                "fio": row[1],
+                "group": row[2],
+                "exams": json.loads(row[3]),
+                "avg_grade": round(row[4], 2)
+            })
+        return students
+
+    def get_group_stats(self):
+        self.cursor.execute('''
+            SELECT group_name, COUNT(*),
+                   SUM(avg_grade * exam_count) / SUM(exam_count)
+            FROM students
+            WHERE exam_count > 0
+            GROUP BY group_name
+            ORDER BY group_name
+        ''')
+        return [{
+            "group": row[0],
+            "students": row[1],
+            "avg_grade": round(row[2], 2)
+        } for row in self.cursor.fetchall()]
+
+    def get_subject_stats(self):
+        self.cursor.execute('''
+            SELECT subject, grade, COUNT(*)
+            FROM grades
+            GROUP BY subject, grade
+            ORDER BY subject, grade
+        ''')
+        subjects = {}
+        for subject, grade, count in self.cursor.fetchall():
+            stats = subjects.setdefault(subject, {
+                "subject": subject,
+                "count": 0,
+                "total": 0,
+                "distribution": {}
+            })
+            stats["count"] += count
+            stats["total"] += grade * count
+            stats["distribution"][grade] = count
+        for stats in subjects.values():
+            stats["avg_grade"] = round(stats.pop("total") / stats["count"], 2)
+        return list(subjects.values())
+
+    def get_top_students(self, limit):
+        self.cursor.execute('''
+            SELECT s.id, s.fio, s.group_name, e.exams_data, s.avg_grade
+            FROM students s
+            CROSS JOIN exams e ON s.id = e.student_id
+            WHERE s.avg_grade IS NOT NULL
+            ORDER BY s.avg_grade DESC, s.id
+            LIMIT ?
+        ''', (limit,))
+        students = []
+        for row in self.cursor.fetchall():
+            students.append({
+                "id": row[0],
+                "fio": row[1],
+                "group": row[2],
+                "exams": json.loads(row[3]),
+                "avg_grade": round(row[4], 2)
+            })
+        return students
+
+    def delete_student(self, student_id):
+        self.cursor.execute('DELETE FROM grades WHERE student_id = ?', (student_id,))
+        self.cursor.execute('DELETE FROM exams WHERE student_id = ?', (student_id,))
+        self.cursor.execute('DELETE FROM students WHERE id = ?', (student_id,))
+        self.conn.commit()
+
+    def delete_students(self, student_ids):
+        student_ids = list(set(student_ids))
+        if not student_ids:
+            return 0
+        try:
+            if len(student_ids) <= self.MAX_IN_PARAMS:
+                placeholders = ", ".join("?" * len(student_ids))
+                id_set = f"({placeholders})"
+                params = student_ids
+            else:
+                self.cursor.execute('''
+                    CREATE TEMP TABLE IF NOT EXISTS delete_ids (
+                        id INTEGER PRIMARY KEY
+                    )
+                ''')
+                self.cursor.execute("DELETE FROM delete_ids")
+                self.cursor.executemany(
+                    "INSERT INTO delete_ids (id) VALUES (?)",
+                    [(student_id,) for student_id in student_ids])
+                id_set = "(SELECT id FROM delete_ids)"
+                params = []
+
+            self.cursor.execute(
+                f"DELETE FROM grades WHERE student_id IN {id_set}", params)
+            self.cursor.execute(
+                f"DELETE FROM exams WHERE student_id IN {id_set}", params)
+            self.cursor.execute(
+                f"DELETE FROM students WHERE id IN {id_set}", params)
+            deleted = self.cursor.rowcount
+            if not params:
+                self.cursor.execute("DELETE FROM delete_ids")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return deleted
+
+    def delete_student_ranges(self, id_ranges):
+        if not id_ranges:
+            return 0
+        try:
+            self.cursor.executemany(
+                "DELETE FROM grades WHERE student_id BETWEEN ? AND ?",
+                id_ranges)
+            self.cursor.executemany(
+                "DELETE FROM exams WHERE student_id BETWEEN ? AND ?",
+                id_ranges)
+            self.cursor.executemany(
+                "DELETE FROM students WHERE id BETWEEN ? AND ?", id_ranges)
+            deleted = self.cursor.rowcount
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return deleted
+
+    def clear_db(self):
+        try:
+            self.cursor.execute("DELETE FROM grades")
+            self.cursor.execute("DELETE FROM exams")
+            self.cursor.execute("DROP TRIGGER IF EXISTS students_fts_delete")
+            self.cursor.execute(
+                "INSERT INTO students_fts (students_fts) VALUES ('delete-all')")
+            self.cursor.execute("DELETE FROM students")
+            self.cursor.execute(self.FTS_DELETE_TRIGGER)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def get_total_students(self):
+        self.cursor.execute("SELECT COUNT(*) FROM students")
+        return self.cursor.fetchone()[0]
+
+    def get_paginated_students(self, limit, offset):
+        self.cursor.execute('''
+            SELECT s.id, s.fio, s.group_name, e.exams_data 
+            FROM students s
+            JOIN exams e ON s.id = e.student_id
+            LIMIT ? OFFSET ?
+        ''', (limit, offset))
+        return self.fetch_students()
+
+    def get_students_after(self, after_id, limit):
+        self.cursor.execute('''
+            SELECT s.id, s.fio, s.group_name, e.exams_data
+            FROM students s
+            JOIN exams e ON s.id = e.student_id
+            WHERE s.id > ?
+            ORDER BY s.id
+            LIMIT ?
+        ''', (after_id, limit))
+        return self.fetch_students()
+
+    def get_students_before(self, before_id, limit):
+        if before_id is None:
+            self.cursor.execute('''
+                SELECT s.id, s.fio, s.group_name, e.exams_data
+                FROM students s
+                JOIN exams e ON s.id = e.student_id
+                ORDER BY s.id DESC
+                LIMIT ?
+            ''', (limit,))
+        else:
+            self.cursor.execute('''
+                SELECT s.id, s.fio, s.group_name, e.exams_data
+                FROM students s
+                JOIN exams e ON s.id = e.student_id
+                WHERE s.id < ?
+                ORDER BY s.id DESC
+                LIMIT ?
+            ''', (before_id, limit))
+        students = self.fetch_students()
+        students.reverse()
+        return students
+
+    def get_page_boundaries(self, limit):
+        self.cursor.execute('''
+            SELECT rn / ? + 1, id - 1
+            FROM (
+                SELECT s.id, ROW_NUMBER() OVER (ORDER BY s.id) - 1 AS rn
+                FROM students s
+                JOIN exams e ON s.id = e.student_id
+            )
+            WHERE rn % ? = 0
+        ''', (limit, limit))
+        return dict(self.cursor.fetchall())
+    
+    def get_total_items(self):
+        self.cursor.execute("SELECT COUNT(*) FROM students")
         return self.cursor.fetchone()[0]
\ No newline at end of file
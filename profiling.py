@@ -0,0 +1,113 @@
+import cProfile
+import functools
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+
+
+class Profiler:
+    OPERATIONS = {
+        "load": "import",
+        "load_from_sql": "import",
+        "load_snapshot": "import",
+        "save_to_xml": "export",
+        "save_to_sql": "export",
+        "save_snapshot": "export",
+        "search_by_group": "search",
+        "search_by_fio": "search",
+        "search_by_avg_grade": "search",
+        "search_by_exam_grade": "search",
+    }
+    TRACE_FRAMES = 10
+    TOP_LINES = 30
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.sequence = 0
+        self.operations = []
+        self.started = None
+        self.start_snapshot = None
+
+    def start(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tracemalloc.start(self.TRACE_FRAMES)
+        self.started = time.perf_counter()
+        self.start_snapshot = tracemalloc.take_snapshot()
+        return self
+
+    def instrument(self, cls, operations=None):
+        for name, category in (operations or self.OPERATIONS).items():
+            setattr(cls, name, self.wrap(category, name, getattr(cls, name)))
+
+    def wrap(self, category, name, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            return self.run(category, name, function, *args, **kwargs)
+        return wrapper
+
+    def run(self, category, name, function, *args, **kwargs):
+        if not self.lock.acquire(blocking=False):
+            return function(*args, **kwargs)
+        try:
+            self.sequence += 1
+            prefix = os.path.join(
+                self.directory, f"{self.sequence:04d}_{category}_{name}")
+            tracemalloc.reset_peak()
+            before = tracemalloc.take_snapshot()
+            profile = cProfile.Profile()
+            start = time.perf_counter()
+            profile.enable()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profile.disable()
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                after = tracemalloc.take_snapshot()
+                self.dump(prefix, profile, before, after, elapsed, peak)
+                self.operations.append(
+                    (os.path.basename(prefix), elapsed, peak))
+        finally:
+            self.lock.release()
+
+    def dump(self, prefix, profile, before, after, elapsed, peak):
+        profile.dump_stats(prefix + ".prof")
+        with open(prefix + ".txt", 'w', encoding='utf-8') as f:
+            f.write(f"time: {elapsed:.4f} s\n")
+            f.write(f"peak memory: {peak} bytes\n\n")
+            f.write(self.format_stats(profile))
+            f.write("\nmemory difference:\n")
+            f.write(self.format_memory(after.compare_to(before, 'lineno')))
+
+    def format_stats(self, profile):
+        stream = io.StringIO()
+        stats = pstats.Stats(profile, stream=stream)
+        stats.strip_dirs().sort_stats("cumulative").print_stats(
+            self.TOP_LINES)
+        return stream.getvalue()
+
+    def format_memory(self, stats):
+        return "".join(f"{stat}\n" for stat in stats[:self.TOP_LINES])
+
+    def stop(self):
+        if self.started is None:
+            return
+        elapsed = time.perf_counter() - self.started
+        current = tracemalloc.get_traced_memory()[0]
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        with open(os.path.join(self.directory, "session.txt"), 'w',
+                  encoding='utf-8') as f:
+            f.write(f"session: {elapsed:.4f} s\n")
+            f.write(f"memory: {current} bytes\n\n")
+            for name, seconds, operation_peak in self.operations:
+                f.write(f"{name}: {seconds:.4f} s, "
+                        f"peak {operation_peak} bytes\n")
+            f.write("\nmemory difference:\n")
+            f.write(self.format_memory(
+                snapshot.compare_to(self.start_snapshot, 'lineno')))
+        self.started = None
@@ -1,858 +1,1504 @@
-from tkinter import *
-from tkinter import ttk, messagebox, filedialog
-from controller import Controller
-from model import Database
-
-
-class Paginator:
-    def __init__(self, controller, records_per_page=5, current_page=1):
-        self.controller = controller
-        self.records_per_page = records_per_page
-        self.current_page = current_page
-        self.total_records = self.controller.get_total()
-
-    def get_total_pages(self):
-        return (self.total_records + self.records_per_page -
-                1) // self.records_per_page
-
-    def get_paginated_data(self):
-        start_idx = (self.current_page - 1) * self.records_per_page
-        return self.controller.get_paginated(self.records_per_page, start_idx)
-
-    def first_page(self):
-        self.current_page = 1
-
-    def prev_page(self):
-        if self.current_page > 1:
-            self.current_page -= 1
-
-    def next_page(self):
-        if self.current_page < self.get_total_pages():
-            self.current_page += 1
-
-    def last_page(self):
-        self.current_page = self.get_total_pages()
-
-    def set_records_per_page(self, records_per_page):
-        self.records_per_page = records_per_page
-        self.current_page = 1
-
-    def update_total_records(self):
-        self.total_records = self.controller.get_total()
-
-
-class TableView:
-    def __init__(self, root, paginator):
-        self.root = root
-        self.paginator = paginator
-        self.main_table_frame = Frame(self.root)
-        self.main_table_frame.pack(fill=BOTH, expand=True, padx=10, pady=5)
-        self.init_table_view()
-
-    def init_table_view(self):
-        h_scrollbar = ttk.Scrollbar(self.main_table_frame, orient=HORIZONTAL)
-        v_scrollbar = ttk.Scrollbar(self.main_table_frame, orient=VERTICAL)
-        self.canvas = Canvas(
-            self.main_table_frame,
-            xscrollcommand=h_scrollbar.set,
-            yscrollcommand=v_scrollbar.set)
-        h_scrollbar.config(command=self.canvas.xview)
-        v_scrollbar.config(command=self.canvas.yview)
-        h_scrollbar.pack(side=BOTTOM, fill=X)
-        v_scrollbar.pack(side=RIGHT, fill=Y)
-        self.canvas.pack(side=LEFT, fill=BOTH, expand=True)
-        self.table_frame = Frame(self.canvas)
-        self.canvas.create_window((0, 0), window=self.table_frame, anchor=NW)
-
-        def on_frame_configure(event):
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        self.table_frame.bind("<Configure>", on_frame_configure)
-
-    def draw_table(self):
-        for widget in self.table_frame.winfo_children():
-            widget.destroy()
-
-        ttk.Label(
-            self.table_frame,
-            text="ФИО студента",
-            width=20).grid(
-            row=1,
-            column=0,
-            padx=10,
-            pady=5)
-        ttk.Label(
-            self.table_frame,
-            text="Группа",
-            width=10).grid(
-            row=1,
-            column=1,
-            padx=5,
-            pady=5)
-        ttk.Label(
-            self.table_frame,
-            text="Экзамены").grid(
-            row=0,
-            column=2,
-            columnspan=100,
-            padx=100,
-            sticky=W,
-            pady=5)
-
-        students = self.paginator.get_paginated_data()
-        max_exams = max(len(student['exams'])
-                        for student in students) if students else 0
-
-        for exam_num in range(max_exams):
-            col = 2 + exam_num
-            ttk.Label(
-                self.table_frame,
-                text=f"Экз.{
-                    exam_num +
-                    1}").grid(
-                row=1,
-                column=col,
-                padx=5,
-                pady=5,
-                sticky=N)
-
-        for i, student in enumerate(students, start=2):
-            ttk.Label(
-                self.table_frame,
-                text=student['fio'],
-                width=20).grid(
-                row=i,
-                column=0,
-                padx=10,
-                sticky=W)
-            ttk.Label(
-                self.table_frame,
-                text=student['group'],
-                width=10).grid(
-                row=i,
-                column=1,
-                padx=5,
-                sticky=W)
-            for exam_num, (subject, grade) in enumerate(
-                    student['exams'].items()):
-                col = 2 + exam_num
-                ttk.Label(
-                    self.table_frame,
-                    text=subject,
-                    wraplength=80).grid(
-                    row=i,
-                    column=col,
-                    padx=25,
-                    sticky=SW)
-                ttk.Label(
-                    self.table_frame,
-                    text=str(grade)).grid(
-                    row=i,
-                    column=col,
-                    sticky=SE)
-
-    def pack(self):
-        self.main_table_frame.pack(fill=BOTH, expand=True, padx=10, pady=5)
-
-    def pack_forget(self):
-        self.main_table_frame.pack_forget()
-
-
-class TreeView:
-    def __init__(self, root, paginator):
-        self.root = root
-        self.paginator = paginator
-        self.tree_frame = Frame(self.root)
-        self.init_tree_view()
-
-    def init_tree_view(self):
-        self.tree = ttk.Treeview(self.tree_frame)
-        self.tree["columns"] = ("group", "exams")
-        self.tree.column("#0", width=200, minwidth=200, stretch=NO)
-        self.tree.column("group", width=100, minwidth=100, stretch=NO)
-        self.tree.column("exams", width=400, minwidth=200)
-        self.tree.heading("#0", text="ФИО студента", anchor=W)
-        self.tree.heading("group", text="Группа", anchor=W)
-        self.tree.heading("exams", text="Экзамены", anchor=W)
-        scrollbar = ttk.Scrollbar(
-            self.tree_frame,
-            orient="vertical",
-            command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side="right", fill="y")
-        self.tree.pack(side="left", fill="both", expand=True)
-
-    def show_tree_view(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        students = self.paginator.get_paginated_data()
-        for i, student in enumerate(students):
-            student_id = f"student_{i}"
-            exams_str = ", ".join(
-                f"{k}:{v}" for k,
-                v in student['exams'].items())
-            self.tree.insert(
-                "",
-                "end",
-                iid=student_id,
-                text=student['fio'],
-                values=(
-                    student['group'],
-                    exams_str))
-            for subject, grade in student['exams'].items():
-                exam_id = f"{student_id}_{subject}"
-                self.tree.insert(
-                    student_id,
-                    "end",
-                    iid=exam_id,
-                    text=subject,
-                    values=(
-                        "",
-                        str(grade)))
-
-    def pack(self):
-        self.tree_frame.pack(fill=BOTH, expand=True, padx=10, pady=5)
-
-    def pack_forget(self):
-        self.tree_frame.pack_forget()
-
-
-class Main:
-    def __init__(self, controller):
-        self.root = Tk()
-        self.controller = controller
-        self.root.title('Students_base')
-        self.root.geometry("800x400")
-        self.root.resizable(False, False)
-        self.view_mode = "table"
-
-        self.Menu()
-        self.paginator = Paginator(self.controller)
-        self.createPaginationControls()
-        self.createViewToggle()
-        self.table_view = TableView(self.root, self.paginator)
-        self.tree_view = TreeView(self.root, self.paginator)
-
-        self.update_view()
-        self.root.mainloop()
-
-    def create_note(self):
-        self.window = Toplevel()
-        self.window.title("Создание записи о студенте")
-        self.window.geometry("500x400")
-
-        main_frame = Frame(self.window)
-        main_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
-
-        canvas = Canvas(main_frame)
-        scrollbar = ttk.Scrollbar(
-            main_frame,
-            orient=VERTICAL,
-            command=canvas.yview)
-        scrollable_frame = Frame(canvas)
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        ttk.Label(scrollable_frame, text="ФИО студента:").pack(pady=(5, 0))
-        self.fio_entry = ttk.Entry(scrollable_frame, width=40)
-        self.fio_entry.pack(pady=(0, 10))
-
-        ttk.Label(scrollable_frame, text="Номер группы:").pack()
-        self.group_entry = ttk.Entry(scrollable_frame, width=40)
-        self.group_entry.pack(pady=(0, 15))
-
-        self.exams_frame = LabelFrame(scrollable_frame, text="Экзамены")
-        self.exams_frame.pack(fill=X, pady=5)
-
-        ttk.Button(
-            scrollable_frame,
-            text="Добавить экзамен",
-            command=self.add_exam_field).pack(
-            pady=5)
-        self.exam_entries = []
-        self.add_exam_field()
-
-        buttons_frame = Frame(scrollable_frame)
-        buttons_frame.pack(pady=10)
-
-        ttk.Button(
-            buttons_frame,
-            text="Сохранить",
-            command=self.save_student).pack(
-            side=LEFT,
-            padx=5)
-        ttk.Button(
-            buttons_frame,
-            text="Отмена",
-            command=self.window.destroy).pack(
-            side=LEFT,
-            padx=5)
-
-    def add_exam_field(self):
-        exam_frame = Frame(self.exams_frame)
-        exam_frame.pack(fill=X, pady=2)
-
-        ttk.Label(exam_frame, text="Предмет:").pack(side=LEFT, padx=(0, 5))
-        subject_entry = ttk.Entry(exam_frame, width=20)
-        subject_entry.pack(side=LEFT)
-
-        ttk.Label(exam_frame, text="Оценка:").pack(side=LEFT, padx=(10, 5))
-        grade_entry = ttk.Entry(exam_frame, width=5)
-        grade_entry.pack(side=LEFT)
-
-        ttk.Button(
-            exam_frame,
-            text="✕",
-            width=3,
-            command=lambda f=exam_frame: self.remove_exam_field(f)).pack(
-            side=RIGHT,
-            padx=(
-                5,
-                0))
-        self.exam_entries.append((subject_entry, grade_entry))
-
-    def remove_exam_field(self, frame):
-        for entry_pair in self.exam_entries:
-            if entry_pair[0].master == frame:
-                self.exam_entries.remove(entry_pair)
-                break
-        frame.destroy()
-
-    def save_student(self):
-        fio = self.fio_entry.get().strip()
-        group = self.group_entry.get().strip()
-        exams = {}
-        for subject_entry, grade_entry in self.exam_entries:
-            subject = subject_entry.get().strip()
-            grade = grade_entry.get().strip()
-            if not subject:
-                messagebox.showerror("Ошибка", "Введите название экзамена")
-                return
-            if not grade:
-                messagebox.showerror("Ошибка", "Введите балл за экзамен")
-                return
-            try:
-                exams[subject] = int(grade)
-            except ValueError:
-                messagebox.showerror(
-                    "Ошибка", f"Некорректная оценка для предмета '{subject}'")
-                return
-
-        if not fio or not group or not exams:
-            messagebox.showerror(
-                "Ошибка", "Заполните все поля и добавьте хотя бы один экзамен")
-            return
-
-        student_data = {'fio': fio, 'group': group, 'exams': exams}
-        if self.controller.create(student_data) == True:
-            messagebox.showinfo(
-                "Успешно", f"Студент {
-                    student_data['fio']} успешно добавлен!")
-            self.window.destroy()
-            self.refresh_data()
-        else:
-            messagebox.showerror(
-                "Ошибка ввода данных", "\n".join(
-                    self.controller.create(student_data)))
-
-    def refresh_data(self):
-        self.paginator.update_total_records()
-        self.paginator.first_page()
-        self.update_view()
-
-    def find_note(self):
-        self.search_window = Toplevel()
-        self.search_window.title("Поиск студентов")
-        self.search_window.resizable(False, False)
-
-        search_frame = Frame(self.search_window)
-        search_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
-        search_criteria_frame = LabelFrame(
-            search_frame, text="Критерии поиска")
-        search_criteria_frame.pack(fill=X, pady=5)
-
-        self.search_mode = StringVar(value="group")
-        search_options = [
-            ("По номеру группы", "group"),
-            ("По среднему баллу студента и наличию экзамена", "avg_grade"),
-            ("По баллу за конкретный экзамен", "exam_grade")
-        ]
-
-        for i, (text, mode) in enumerate(search_options):
-            rb = Radiobutton(search_criteria_frame, text=text, variable=self.search_mode,
-                             value=mode, command=self.toggle_search_fields)
-            rb.grid(row=0, column=i, padx=5, pady=5, sticky=W)
-
-        self.search_input_frame = Frame(search_criteria_frame)
-        self.search_input_frame.grid(
-            row=1, column=0, columnspan=3, sticky=EW, pady=5)
-
-        search_btn = Button(
-            search_criteria_frame,
-            text="Найти",
-            command=self.perform_search)
-        search_btn.grid(row=2, column=0, columnspan=3, pady=10)
-
-        results_frame = LabelFrame(search_frame, text="Результаты поиска")
-        results_frame.pack(fill=BOTH, expand=True, pady=5)
-
-        self.results_tree = ttk.Treeview(results_frame, columns=(
-            "fio", "group", "exams", "avg_grade"), show="headings")
-        self.results_tree.heading("fio", text="ФИО")
-        self.results_tree.heading("group", text="Группа")
-        self.results_tree.heading("exams", text="Экзамены")
-        self.results_tree.heading("avg_grade", text="Ср. балл")
-        self.results_tree.column("fio", width=200, anchor=W)
-        self.results_tree.column("group", width=100, anchor=CENTER)
-        self.results_tree.column("exams", width=300, anchor=W)
-        self.results_tree.column("avg_grade", width=80, anchor=CENTER)
-
-        scroll_y = ttk.Scrollbar(
-            results_frame,
-            orient=VERTICAL,
-            command=self.results_tree.yview)
-        scroll_x = ttk.Scrollbar(
-            results_frame,
-            orient=HORIZONTAL,
-            command=self.results_tree.xview)
-        self.results_tree.configure(
-            yscrollcommand=scroll_y.set,
-            xscrollcommand=scroll_x.set)
-
-        self.results_tree.pack(side=LEFT, fill=BOTH, expand=True)
-        scroll_y.pack(side=RIGHT, fill=Y)
-        scroll_x.pack(side=BOTTOM, fill=X)
-        self.toggle_search_fields()
-
-    def toggle_search_fields(self):
-        for widget in self.search_input_frame.winfo_children():
-            widget.destroy()
-
-        mode = self.search_mode.get()
-        if mode == "group":
-            self.group_label = Label(
-                self.search_input_frame,
-                text="Номер группы:")
-            self.group_entry = Entry(self.search_input_frame, width=20)
-            self.group_label.grid(row=0, column=0, padx=5, pady=5, sticky=E)
-            self.group_entry.grid(row=0, column=1, padx=5, pady=5, sticky=W)
-        elif mode == "avg_grade":
-            self.avg_min_label = Label(
-                self.search_input_frame,
-                text="Средний балл от:")
-            self.avg_min_entry = Entry(self.search_input_frame, width=5)
-            self.avg_max_label = Label(self.search_input_frame, text="до:")
-            self.avg_max_entry = Entry(self.search_input_frame, width=5)
-            self.exam1_name_label = Label(
-                self.search_input_frame, text="Название экзамена:")
-            self.exam1_name_entry = Entry(self.search_input_frame, width=20)
-            self.avg_min_label.grid(row=1, column=0, padx=5, pady=5, sticky=E)
-            self.avg_min_entry.grid(row=1, column=1, padx=5, pady=5, sticky=W)
-            self.avg_max_label.grid(row=1, column=2, padx=5, pady=5, sticky=E)
-            self.avg_max_entry.grid(row=1, column=3, padx=5, pady=5, sticky=W)
-            self.exam1_name_label.grid(
-                row=0, column=0, padx=5, pady=5, sticky=E)
-            self.exam1_name_entry.grid(
-                row=0, column=1, padx=5, pady=5, sticky=W)
-        elif mode == "exam_grade":
-            self.exam_name_label = Label(
-                self.search_input_frame,
-                text="Название экзамена:")
-            self.exam_name_entry = Entry(self.search_input_frame, width=20)
-            self.exam_min_label = Label(
-                self.search_input_frame, text="Балл от:")
-            self.exam_min_entry = Entry(self.search_input_frame, width=5)
-            self.exam_max_label = Label(self.search_input_frame, text="до:")
-            self.exam_max_entry = Entry(self.search_input_frame, width=5)
-            self.exam_name_label.grid(
-                row=0, column=0, padx=5, pady=5, sticky=E)
-            self.exam_name_entry.grid(
-                row=0, column=1, padx=5, pady=5, sticky=W)
-            self.exam_min_label.grid(row=1, column=0, padx=5, pady=5, sticky=E)
-            self.exam_min_entry.grid(row=1, column=1, padx=5, pady=5, sticky=W)
-            self.exam_max_label.grid(row=1, column=2, padx=5, pady=5, sticky=E)
-            self.exam_max_entry.grid(row=1, column=3, padx=5, pady=5, sticky=W)
-
-    def perform_search(self):
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-
-        mode = self.search_mode.get()
-        try:
-            if mode == "group":
-                group = self.group_entry.get().strip()
-                if not group:
-                    messagebox.showwarning("Ошибка", "Введите номер группы")
-                    return
-                result = self.controller.search_by_group(group)
-                if isinstance(result, list):
-                    self.results = result
-                    self.display_results()
-                else:
-                    messagebox.showerror("Ошибка ввода данных", result)
-                    self.results = []
-            elif mode == "avg_grade":
-                exam_name1 = self.exam1_name_entry.get().strip()
-                if not exam_name1 or not self.avg_min_entry.get() or not self.avg_max_entry.get():
-                    messagebox.showwarning("Ошибка", "Заполните все поля")
-                    return
-                min_avg = int(self.avg_min_entry.get())
-                max_avg = int(self.avg_max_entry.get())
-                result = self.controller.search_by_avg_grade(
-                    exam_name1, min_avg, max_avg)
-                if isinstance(result, list):
-                    self.results = result
-                    self.display_results()
-                else:
-                    messagebox.showerror("Ошибка ввода данных", result)
-                    self.results = []
-            elif mode == "exam_grade":
-                exam_name = self.exam_name_entry.get().strip()
-                if not exam_name or not self.exam_min_entry.get() or not self.exam_max_entry.get():
-                    messagebox.showwarning("Ошибка", "Заполните все поля")
-                    return
-                min_grade = float(self.exam_min_entry.get())
-                max_grade = float(self.exam_max_entry.get())
-                result = self.controller.search_by_exam_grade(
-                    exam_name, min_grade, max_grade)
-                if isinstance(result, list):
-                    self.results = result
-                    self.display_results()
-                else:
-                    messagebox.showerror("Ошибка ввода данных", result)
-                    self.results = []
-        except ValueError:
-            messagebox.showerror("Ошибка", "Некорректный формат данных")
-
-    def display_results(self):
-        if not self.results:
-            messagebox.showinfo("Результаты", "Студенты не найдены")
-            return
-        found_students = 0
-        for student in self.results:
-            found_students += 1
-            exams_str = ", ".join(
-                [f"{subject}: {grade}" for subject, grade in student['exams'].items()])
-            self.results_tree.insert(
-                "",
-                "end",
-                values=(
-                    student['fio'],
-                    student['group'],
-                    exams_str,
-                    student.get(
-                        'avg_grade',
-                        '')))
-        messagebox.showinfo("Результаты",
-                            f"Студентов найдено: {found_students}")
-
-    def delete_note(self):
-        self.deletion_window = Toplevel()
-        self.deletion_window.title("Удаление студентов")
-        self.deletion_window.resizable(False, False)
-
-        deletion_frame = Frame(self.deletion_window)
-        deletion_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
-        search_criteria_frame = LabelFrame(
-            deletion_frame, text="Критерии поиска")
-        search_criteria_frame.pack(fill=X, pady=5)
-
-        self.search_mode = StringVar(value="group")
-        search_options = [
-            ("По номеру группы", "group"),
-            ("По среднему баллу студента и наличию экзамена", "avg_grade"),
-            ("По баллу за конкретный экзамен", "exam_grade")
-        ]
-
-        for i, (text, mode) in enumerate(search_options):
-            rb = Radiobutton(search_criteria_frame, text=text, variable=self.search_mode,
-                             value=mode, command=self.toggle_search_fields)
-            rb.grid(row=0, column=i, padx=5, pady=5, sticky=W)
-
-        self.search_input_frame = Frame(search_criteria_frame)
-        self.search_input_frame.grid(
-            row=1, column=0, columnspan=3, sticky=EW, pady=5)
-
-        search_btn = Button(
-            search_criteria_frame,
-            text="Найти и удалить",
-            command=self.perform_search_for_deletion)
-        search_btn.grid(row=2, column=0, columnspan=3, pady=10)
-
-        results_frame = LabelFrame(
-            deletion_frame,
-            text="Результаты: записи, которые были удалены")
-        results_frame.pack(fill=BOTH, expand=True, pady=5)
-
-        self.results_tree = ttk.Treeview(results_frame, columns=(
-            "fio", "group", "exams", "avg_grade"), show="headings")
-        self.results_tree.heading("fio", text="ФИО")
-        self.results_tree.heading("group", text="Группа")
-        self.results_tree.heading("exams", text="Экзамены")
-        self.results_tree.heading("avg_grade", text="Ср. балл")
-        self.results_tree.column("fio", width=200, anchor=W)
-        self.results_tree.column("group", width=100, anchor=CENTER)
-        self.results_tree.column("exams", width=300, anchor=W)
-        self.results_tree.column("avg_grade", width=80, anchor=CENTER)
-
-        scroll_y = ttk.Scrollbar(
-            results_frame,
-            orient=VERTICAL,
-            command=self.results_tree.yview)
-        scroll_x = ttk.Scrollbar(
-            results_frame,
-            orient=HORIZONTAL,
-            command=self.results_tree.xview)
-        self.results_tree.configure(
-            yscrollcommand=scroll_y.set,
-            xscrollcommand=scroll_x.set)
-
-        self.results_tree.pack(side=LEFT, fill=BOTH, expand=True)
-        scroll_y.pack(side=RIGHT, fill=Y)
-        scroll_x.pack(side=BOTTOM, fill=X)
-        self.toggle_search_fields()
-
-    def perform_search_for_deletion(self):
-        self.results = []
-        self.perform_search()
-        if self.results:
-            success, failed = self.controller.delete(self.results)
-            messagebox.showinfo(
-                "Удаление", f"Удалено успешно: {success}, неудач: {failed}")
-            self.refresh_data()
-
-    def clear_db(self):
-        if self.controller.clear_db():
-            messagebox.showinfo("Успех", "База данных успешно очищена")
-            self.refresh_data()
-        else:
-            messagebox.showerror("Ошибка", "Не удалось очистить базу данных")
-
-    def load_state(self):
-        file_path = self.controller.find_path()
-        if not file_path:
-            return
-        if messagebox.askyesno(
-                "Подтверждение", "Очистить текущую базу данных перед загрузкой?"):
-            self.clear_db()
-        if self.controller.load(file_path):
-            messagebox.showinfo("Успех", "Данные успешно загружены из файла")
-            self.refresh_data()
-        else:
-            messagebox.showerror(
-                "Ошибка", "Не удалось загрузить данные из файла")
-
-    def save_data(self):
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".xml", filetypes=[
-                ("XML files", "*.xml")], title="Сохранить базу данных")
-        if file_path:
-            if self.controller.save_to_xml(file_path):
-                messagebox.showinfo("Успех", "База данных успешно сохранена")
-            else:
-                messagebox.showerror("Ошибка", "Не удалось сохранить данные")
-
-    def save_to_sql(self):
-        file_path = filedialog.asksaveasfilename(defaultextension=".sql", filetypes=[(
-            "SQL files", "*.sql"), ("All files", "*.*")], title="Сохранить базу данных как SQL")
-        if file_path:
-            if self.controller.save_to_sql(file_path):
-                messagebox.showinfo(
-                    "Успех", "База данных успешно экспортирована в SQL")
-            else:
-                messagebox.showerror(
-                    "Ошибка", "Не удалось экспортировать данные")
-
-    def load_from_sql(self):
-        file_path = self.controller.find_path_sql()
-        if not file_path:
-            return
-        if messagebox.askyesno(
-                "Подтверждение", "Очистить текущую базу данных перед загрузкой?"):
-            self.clear_db()
-        if self.controller.load_from_sql(file_path):
-            messagebox.showinfo("Успех", "Данные успешно загружены из SQL")
-            self.refresh_data()
-        else:
-            messagebox.showerror("Ошибка", "Ошибка загрузки SQL файла")
-
-    def Menu(self):
-        btn_frame = Frame(self.root)
-        btn_frame.pack(fill=X, padx=5, pady=5)
-        ttk.Button(
-            btn_frame,
-            text="Создать запись",
-            command=self.create_note).pack(
-            side=LEFT,
-            padx=5)
-        ttk.Button(
-            btn_frame,
-            text="Удалить запись",
-            command=self.delete_note).pack(
-            side=LEFT,
-            padx=5)
-        ttk.Button(
-            btn_frame,
-            text="Найти запись",
-            command=self.find_note).pack(
-            side=LEFT,
-            padx=5)
-        ttk.Button(
-            btn_frame,
-            text="Загрузить из XML",
-            command=self.load_state).pack(
-            side=LEFT,
-            padx=5)
-        ttk.Button(
-            btn_frame,
-            text="Сохранить в XML",
-            command=self.save_data).pack(
-            side=LEFT,
-            padx=5)
-        ttk.Button(
-            btn_frame,
-            text="Загрузить из БД",
-            command=self.load_from_sql).pack(
-            side=LEFT,
-            padx=5)
-        ttk.Button(
-            btn_frame,
-            text="Сохранить в БД",
-            command=self.save_to_sql).pack(
-            side=LEFT,
-            padx=5)
-
-    def createViewToggle(self):
-        toggle_frame = Frame(self.root)
-        toggle_frame.pack(fill=X, padx=5, pady=2)
-        self.view_var = StringVar(value="table")
-        ttk.Radiobutton(
-            toggle_frame,
-            text="Таблица",
-            variable=self.view_var,
-            value="table",
-            command=self.toggle_view).pack(
-            side=LEFT,
-            padx=5)
-        ttk.Radiobutton(
-            toggle_frame,
-            text="Дерево",
-            variable=self.view_var,
-            value="tree",
-            command=self.toggle_view).pack(
-            side=LEFT,
-            padx=5)
-
-    def toggle_view(self):
-        self.view_mode = self.view_var.get()
-        if self.view_mode == "table":
-            self.tree_view.pack_forget()
-            self.table_view.pack()
-        else:
-            self.table_view.pack_forget()
-            self.tree_view.pack()
-        self.update_view()
-
-    def createPaginationControls(self):
-        pagination_frame = Frame(self.root)
-        pagination_frame.pack(fill=X, padx=5, pady=5)
-
-        ttk.Label(
-            pagination_frame,
-            text="Записей на странице:").pack(
-            side=LEFT,
-            padx=5)
-        self.records_var = StringVar(
-            value=str(self.paginator.records_per_page))
-        records_combo = ttk.Combobox(
-            pagination_frame, textvariable=self.records_var, values=[
-                1, 5, 10, 15, 20, 25, 50], width=5)
-        records_combo.pack(side=LEFT, padx=5)
-        records_combo.bind(
-            "<<ComboboxSelected>>",
-            self.change_records_per_page)
-
-        ttk.Button(
-            pagination_frame,
-            text="<< Первая",
-            command=self.first_page).pack(
-            side=LEFT,
-            padx=5)
-        ttk.Button(
-            pagination_frame,
-            text="< Предыдущая",
-            command=self.prev_page).pack(
-            side=LEFT,
-            padx=5)
-
-        self.page_info_frame = Frame(pagination_frame)
-        self.page_info_frame.pack(side=LEFT, padx=5)
-
-        self.page_label = ttk.Label(
-            self.page_info_frame, text=f"Страница {
-                self.paginator.current_page} из {
-                self.paginator.get_total_pages()}")
-        self.page_label.pack()
-
-        self.total_records_label = ttk.Label(
-            self.page_info_frame, text=f"Всего записей: {
-                self.paginator.total_records}")
-        self.total_records_label.pack()
-
-        ttk.Button(
-            pagination_frame,
-            text="Следующая >",
-            command=self.next_page).pack(
-            side=LEFT,
-            padx=5)
-        ttk.Button(
-            pagination_frame,
-            text="Последняя >>",
-            command=self.last_page).pack(
-            side=LEFT,
-            padx=5)
-
-    def update_pagination_info(self):
-        self.page_label.config(
-            text=f"Страница {
-                self.paginator.current_page} из {
-                self.paginator.get_total_pages()}")
-        self.total_records_label.config(
-            text=f"Всего записей: {
-                self.paginator.total_records}")
-
-    def change_records_per_page(self, event):
-        self.paginator.set_records_per_page(int(self.records_var.get()))
-        self.update_view()
-
-    def first_page(self):
-        self.paginator.first_page()
-        self.update_view()
-
-    def prev_page(self):
-        self.paginator.prev_page()
-        self.update_view()
-
-    def next_page(self):
-        self.paginator.next_page()
-        self.update_view()
-
-    def last_page(self):
-        self.paginator.last_page()
-        self.update_view()
-
-    def update_view(self):
-        if self.view_mode == "table":
-            self.table_view.draw_table()
-        else:
-            self.tree_view.show_tree_view()
-        self.update_pagination_info()
+from tkinter import *
+from tkinter import ttk, messagebox, filedialog
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from controller import Controller, OperationCancelled
+from model import Database
+
+
+class Paginator:
+    PREFETCH_SIZE = 4
+
+    def __init__(self, controller, records_per_page=5, current_page=1,
+                 keyset=True):
+        self.controller = controller
+        self.records_per_page = records_per_page
+        self.current_page = current_page
+        self.keyset = keyset
+        self.page_boundaries = {1: 0}
+        self.prefetched = OrderedDict()
+        self.prefetch_executor = None
+        self.worker = threading.local()
+        self.total_records = self.controller.get_total()
+
+    def get_total_pages(self):
+        return (self.total_records + self.records_per_page -
+                1) // self.records_per_page
+
+    def get_paginated_data(self):
+        students = self.take_prefetched(self.current_page)
+        if students is None:
+            if not self.keyset:
+                start_idx = (self.current_page - 1) * self.records_per_page
+                return self.controller.get_paginated(
+                    self.records_per_page, start_idx)
+            students = self.seek_page(self.current_page)
+
+        if self.keyset and students:
+            self.page_boundaries[self.current_page] = students[0]['id'] - 1
+            self.page_boundaries[self.current_page + 1] = students[-1]['id']
+        return students
+
+    def page_query(self, page):
+        limit = self.records_per_page
+        if not self.keyset:
+            return "get_paginated", (limit, (page - 1) * limit)
+        if page in self.page_boundaries:
+            return "get_paginated_after", (limit, self.page_boundaries[page])
+        if page + 1 in self.page_boundaries:
+            return "get_paginated_before", (
+                limit, self.page_boundaries[page + 1] + 1)
+        return None
+
+    def seek_page(self, page):
+        limit = self.records_per_page
+        query = self.page_query(page)
+        if query:
+            name, args = query
+            return getattr(self.controller, name)(*args)
+        if page == self.get_total_pages():
+            last_page_size = self.total_records - (page - 1) * limit
+            return self.controller.get_paginated_before(
+                last_page_size, None)
+
+        self.page_boundaries.update(
+            self.controller.get_page_boundaries(limit))
+        return self.controller.get_paginated_after(
+            limit, self.page_boundaries.get(page, 0))
+
+    def prefetch_adjacent(self):
+        for page in (self.current_page + 1, self.current_page - 1):
+            if not 1 <= page <= self.get_total_pages() or page in self.prefetched:
+                continue
+            query = self.page_query(page)
+            if query is None:
+                continue
+            if self.prefetch_executor is None:
+                self.prefetch_executor = ThreadPoolExecutor(max_workers=1)
+            self.prefetched[page] = self.prefetch_executor.submit(
+                self.run_prefetch, *query)
+            while len(self.prefetched) > self.PREFETCH_SIZE:
+                self.prefetched.popitem(last=False)
+
+    def run_prefetch(self, name, args):
+        controller = getattr(self.worker, "controller", None)
+        if controller is None:
+            controller = self.worker.controller = self.controller.spawn()
+        return getattr(controller, name)(*args)
+
+    def take_prefetched(self, page):
+        future = self.prefetched.pop(page, None)
+        if future is None or not future.done() or future.exception():
+            return None
+        return future.result()
+
+    def go_to_page(self, page):
+        self.current_page = max(1, min(page, self.get_total_pages()))
+
+    def reset_boundaries(self):
+        self.page_boundaries = {1: 0}
+        self.prefetched.clear()
+
+    def first_page(self):
+        self.current_page = 1
+
+    def prev_page(self):
+        if self.current_page > 1:
+            self.current_page -= 1
+
+    def next_page(self):
+        if self.current_page < self.get_total_pages():
+            self.current_page += 1
+
+    def last_page(self):
+        self.current_page = self.get_total_pages()
+
+    def set_records_per_page(self, records_per_page):
+        self.records_per_page = records_per_page
+        self.current_page = 1
+        self.reset_boundaries()
+
+    def update_total_records(self):
+        self.total_records = self.controller.get_total()
+        self.reset_boundaries()
+
+
+class TableRow:
+    def __init__(self, frame, row):
+        self.frame = frame
+        self.row = row
+        self.visible = True
+        self.visible_exams = 0
+        self.fio = ttk.Label(frame, width=20)
+        self.fio.grid(row=row, column=0, padx=10, sticky=W)
+        self.group = ttk.Label(frame, width=10)
+        self.group.grid(row=row, column=1, padx=5, sticky=W)
+        self.exams = []
+
+    def add_exam_cell(self):
+        col = 2 + len(self.exams)
+        subject_label = ttk.Label(self.frame, wraplength=80)
+        subject_label.grid(row=self.row, column=col, padx=25, sticky=SW)
+        grade_label = ttk.Label(self.frame)
+        grade_label.grid(row=self.row, column=col, sticky=SE)
+        self.exams.append((subject_label, grade_label))
+
+    def show(self, student):
+        if not self.visible:
+            self.fio.grid()
+            self.group.grid()
+            self.visible = True
+        self.fio.configure(text=student['fio'])
+        self.group.configure(text=student['group'])
+
+        exams = list(student['exams'].items())
+        while len(self.exams) < len(exams):
+            self.add_exam_cell()
+        for exam_num, (subject, grade) in enumerate(exams):
+            subject_label, grade_label = self.exams[exam_num]
+            subject_label.configure(text=subject)
+            grade_label.configure(text=str(grade))
+            if exam_num >= self.visible_exams:
+                subject_label.grid()
+                grade_label.grid()
+        self.hide_exams(len(exams))
+
+    def hide_exams(self, start):
+        for subject_label, grade_label in self.exams[start:self.visible_exams]:
+            subject_label.grid_remove()
+            grade_label.grid_remove()
+        self.visible_exams = start
+
+    def hide(self):
+        if self.visible:
+            self.fio.grid_remove()
+            self.group.grid_remove()
+            self.visible = False
+        self.hide_exams(0)
+
+
+class TableView:
+    def __init__(self, root, paginator):
+        self.root = root
+        self.paginator = paginator
+        self.main_table_frame = Frame(self.root)
+        self.main_table_frame.pack(fill=BOTH, expand=True, padx=10, pady=5)
+        self.rows = []
+        self.exam_headers = []
+        self.init_table_view()
+
+    def init_table_view(self):
+        h_scrollbar = ttk.Scrollbar(self.main_table_frame, orient=HORIZONTAL)
+        v_scrollbar = ttk.Scrollbar(self.main_table_frame, orient=VERTICAL)
+        self.canvas = Canvas(
+            self.main_table_frame,
+            xscrollcommand=h_scrollbar.set,
+            yscrollcommand=v_scrollbar.set)
+        h_scrollbar.config(command=self.canvas.xview)
+        v_scrollbar.config(command=self.canvas.yview)
+        h_scrollbar.pack(side=BOTTOM, fill=X)
+        v_scrollbar.pack(side=RIGHT, fill=Y)
+        self.canvas.pack(side=LEFT, fill=BOTH, expand=True)
+        self.table_frame = Frame(self.canvas)
+        self.canvas.create_window((0, 0), window=self.table_frame, anchor=NW)
+
+        def on_frame_configure(event):
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.table_frame.bind("<Configure>", on_frame_configure)
+
+        ttk.Label(
+            self.table_frame,
+            text="ФИО студента",
+            width=20).grid(
+            row=1,
+            column=0,
+            padx=10,
+            pady=5)
+        ttk.Label(
+            self.table_frame,
+            text="Группа",
+            width=10).grid(
+            row=1,
+            column=1,
+            padx=5,
+            pady=5)
+        ttk.Label(
+            self.table_frame,
+            text="Экзамены").grid(
+            row=0,
+            column=2,
+            columnspan=100,
+            padx=100,
+            sticky=W,
+            pady=5)
+
+    def draw_table(self):
+        students = self.paginator.get_paginated_data()
+        max_exams = max(len(student['exams'])
+                        for student in students) if students else 0
+
+        while len(self.exam_headers) < max_exams:
+            exam_num = len(self.exam_headers)
+            header = ttk.Label(
+                self.table_frame,
+                text=f"Экз.{exam_num + 1}")
+            header.grid(
+                row=1,
+                column=2 + exam_num,
+                padx=5,
+                pady=5,
+                sticky=N)
+            self.exam_headers.append(header)
+        for exam_num, header in enumerate(self.exam_headers):
+            if exam_num < max_exams:
+                header.grid()
+            else:
+                header.grid_remove()
+
+        while len(self.rows) < len(students):
+            self.rows.append(TableRow(self.table_frame, len(self.rows) + 2))
+        for row, student in zip(self.rows, students):
+            row.show(student)
+        for row in self.rows[len(students):]:
+            row.hide()
+
+    def pack(self):
+        self.main_table_frame.pack(fill=BOTH, expand=True, padx=10, pady=5)
+
+    def pack_forget(self):
+        self.main_table_frame.pack_forget()
+
+
+class TreeView:
+    def __init__(self, root, paginator):
+        self.root = root
+        self.paginator = paginator
+        self.tree_frame = Frame(self.root)
+        self.rendered = {}
+        self.init_tree_view()
+
+    def init_tree_view(self):
+        self.tree = ttk.Treeview(self.tree_frame)
+        self.tree["columns"] = ("group", "exams")
+        self.tree.column("#0", width=200, minwidth=200, stretch=NO)
+        self.tree.column("group", width=100, minwidth=100, stretch=NO)
+        self.tree.column("exams", width=400, minwidth=200)
+        self.tree.heading("#0", text="ФИО студента", anchor=W)
+        self.tree.heading("group", text="Группа", anchor=W)
+        self.tree.heading("exams", text="Экзамены", anchor=W)
+        scrollbar = ttk.Scrollbar(
+            self.tree_frame,
+            orient="vertical",
+            command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.tree.bind("<<TreeviewOpen>>", self.on_open)
+
+    def show_tree_view(self):
+        students = self.paginator.get_paginated_data()
+        student_ids = [f"student_{student['id']}" for student in students]
+
+        for student_id in set(self.rendered) - set(student_ids):
+            self.tree.delete(student_id)
+            del self.rendered[student_id]
+
+        for index, (student_id, student) in enumerate(
+                zip(student_ids, students)):
+            exams_str = ", ".join(
+                f"{k}:{v}" for k,
+                v in student['exams'].items())
+            state = (student['fio'], student['group'],
+                     tuple(student['exams'].items()))
+            if student_id not in self.rendered:
+                self.tree.insert(
+                    "",
+                    index,
+                    iid=student_id,
+                    text=student['fio'],
+                    values=(
+                        student['group'],
+                        exams_str))
+                if student['exams']:
+                    self.insert_placeholder(student_id)
+            elif self.rendered[student_id] != state:
+                self.tree.item(
+                    student_id,
+                    text=student['fio'],
+                    values=(
+                        student['group'],
+                        exams_str))
+                self.reset_exams(student_id, state[2])
+            self.rendered[student_id] = state
+
+        if list(self.tree.get_children()) != student_ids:
+            for index, student_id in enumerate(student_ids):
+                self.tree.move(student_id, "", index)
+
+    def reset_exams(self, student_id, exams):
+        children = self.tree.get_children(student_id)
+        if children:
+            self.tree.delete(*children)
+        if not exams:
+            return
+        if self.tree.item(student_id, "open"):
+            self.insert_exams(student_id, exams)
+        else:
+            self.insert_placeholder(student_id)
+
+    def insert_placeholder(self, student_id):
+        self.tree.insert(
+            student_id,
+            "end",
+            iid=f"{student_id}_placeholder",
+            text="...")
+
+    def on_open(self, event):
+        student_id = self.tree.focus()
+        if student_id not in self.rendered:
+            return
+        placeholder = f"{student_id}_placeholder"
+        if self.tree.get_children(student_id) == (placeholder,):
+            self.tree.delete(placeholder)
+            self.insert_exams(student_id, self.rendered[student_id][2])
+
+    def insert_exams(self, student_id, exams):
+        for subject, grade in exams:
+            exam_id = f"{student_id}_{subject}"
+            self.tree.insert(
+                student_id,
+                "end",
+                iid=exam_id,
+                text=subject,
+                values=(
+                    "",
+                    str(grade)))
+
+    def pack(self):
+        self.tree_frame.pack(fill=BOTH, expand=True, padx=10, pady=5)
+
+    def pack_forget(self):
+        self.tree_frame.pack_forget()
+
+
+class TaskDialog:
+    POLL_INTERVAL = 100
+
+    def __init__(self, root, executor, title, job, on_done):
+        self.on_done = on_done
+        self.cancel_event = threading.Event()
+        self.progress = (0, 0)
+
+        self.window = Toplevel(root)
+        self.window.title(title)
+        self.window.resizable(False, False)
+        self.window.transient(root)
+        self.window.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        self.label = ttk.Label(self.window, text=title)
+        self.label.pack(padx=10, pady=(10, 5))
+        self.bar = ttk.Progressbar(self.window, length=300)
+        self.bar.pack(padx=10, pady=5)
+        ttk.Button(
+            self.window,
+            text="Отмена",
+            command=self.cancel).pack(
+            pady=(5, 10))
+        self.window.grab_set()
+
+        self.future = executor.submit(job, self.report)
+        self.window.after(self.POLL_INTERVAL, self.poll)
+
+    def report(self, done, total):
+        if self.cancel_event.is_set():
+            raise OperationCancelled()
+        self.progress = (done, total)
+
+    def cancel(self):
+        self.cancel_event.set()
+        self.label.config(text="Отмена...")
+
+    def poll(self):
+        done, total = self.progress
+        if total:
+            self.bar.config(mode="determinate", maximum=total, value=done)
+        else:
+            self.bar.config(mode="indeterminate")
+            self.bar.step(5)
+
+        if not self.future.done():
+            self.window.after(self.POLL_INTERVAL, self.poll)
+            return
+
+        self.window.grab_release()
+        self.window.destroy()
+        try:
+            result = self.future.result()
+        except Exception as e:
+            result = False
+        self.on_done(result, self.cancel_event.is_set())
+
+
+class LiveSearch:
+    DELAY = 300
+    POLL_INTERVAL = 50
+    CHUNK_SIZE = 200
+
+    def __init__(self, root, controller, tree, status):
+        self.root = root
+        self.controller = controller
+        self.tree = tree
+        self.status = status
+        self.generation = 0
+        self.pending = None
+        self.running = None
+        self.lock = threading.Lock()
+        self.worker = threading.local()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def schedule(self, search, delay=DELAY):
+        self.generation += 1
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+        self.interrupt()
+        self.pending = self.root.after(
+            delay, self.start, self.generation, search)
+
+    def cancel(self):
+        self.generation += 1
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+            self.pending = None
+        self.interrupt()
+
+    def interrupt(self):
+        with self.lock:
+            if self.running is not None:
+                self.running.db.interrupt()
+
+    def start(self, generation, search):
+        self.pending = None
+        self.status.config(text="Поиск...")
+        future = self.executor.submit(self.run, generation, search)
+        self.root.after(self.POLL_INTERVAL, self.poll, generation, future)
+
+    def run(self, generation, search):
+        if generation != self.generation:
+            return None
+        controller = getattr(self.worker, "controller", None)
+        if controller is None:
+            controller = self.worker.controller = self.controller.spawn()
+        with self.lock:
+            self.running = controller
+        try:
+            return search(controller, None)
+        finally:
+            with self.lock:
+                self.running = None
+
+    def poll(self, generation, future):
+        if generation != self.generation:
+            return
+        if not future.done():
+            self.root.after(self.POLL_INTERVAL, self.poll, generation, future)
+            return
+
+        self.tree.delete(*self.tree.get_children())
+        try:
+            result = future.result()
+        except Exception as e:
+            result = False
+        if not isinstance(result, list):
+            self.status.config(
+                text=result if isinstance(result, str) else "Ошибка поиска")
+            return
+        self.insert_chunk(generation, result, 0)
+
+    def insert_chunk(self, generation, results, start):
+        if generation != self.generation:
+            return
+        for student in results[start:start + self.CHUNK_SIZE]:
+            self.tree.insert("", "end", values=student_row(student))
+        start += self.CHUNK_SIZE
+        if start < len(results):
+            self.status.config(
+                text=f"Найдено: {len(results)}, показано: {start}")
+            self.root.after(1, self.insert_chunk, generation, results, start)
+        else:
+            self.status.config(text=f"Студентов найдено: {len(results)}")
+
+    def close_worker(self):
+        controller = getattr(self.worker, "controller", None)
+        if controller is not None:
+            controller.db.close()
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.submit(self.close_worker)
+        self.executor.shutdown(wait=False)
+
+
+def student_row(student):
+    exams_str = ", ".join(
+        [f"{subject}: {grade}" for subject, grade in student['exams'].items()])
+    return (
+        student['fio'],
+        student['group'],
+        exams_str,
+        student.get('avg_grade', ''))
+
+
+class Main:
+    def __init__(self, controller):
+        self.root = Tk()
+        self.controller = controller
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.root.title('Students_base')
+        self.root.geometry("800x400")
+        self.root.resizable(False, False)
+        self.view_mode = "table"
+
+        self.Menu()
+        self.paginator = Paginator(self.controller)
+        self.createPaginationControls()
+        self.createViewToggle()
+        self.table_view = TableView(self.root, self.paginator)
+        self.tree_view = TreeView(self.root, self.paginator)
+
+        self.update_view()
+        self.root.mainloop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def run_task(self, title, operation, on_done):
+        def job(report):
+            controller = self.controller.spawn()
+            try:
+                return operation(controller, report)
+            finally:
+                controller.db.close()
+        TaskDialog(self.root, self.executor, title, job, on_done)
+
+    def finish_write_task(self, result, cancelled, success_text, error_text):
+        self.controller.invalidate_cache()
+        if cancelled:
+            messagebox.showwarning("Отменено", "Операция отменена")
+        elif result:
+            messagebox.showinfo("Успех", success_text)
+        else:
+            messagebox.showerror("Ошибка", error_text)
+        self.refresh_data()
+
+    def finish_export_task(self, result, cancelled, success_text, error_text):
+        if cancelled:
+            messagebox.showwarning("Отменено", "Операция отменена")
+        elif result:
+            messagebox.showinfo("Успех", success_text)
+        else:
+            messagebox.showerror("Ошибка", error_text)
+
+    def create_note(self):
+        self.window = Toplevel()
+        self.window.title("Создание записи о студенте")
+        self.window.geometry("500x400")
+
+        main_frame = Frame(self.window)
+        main_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
+
+        canvas = Canvas(main_frame)
+        scrollbar = ttk.Scrollbar(
+            main_frame,
+            orient=VERTICAL,
+            command=canvas.yview)
+        scrollable_frame = Frame(canvas)
+
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        ttk.Label(scrollable_frame, text="ФИО студента:").pack(pady=(5, 0))
+        self.fio_entry = ttk.Entry(scrollable_frame, width=40)
+        self.fio_entry.pack(pady=(0, 10))
+
+        ttk.Label(scrollable_frame, text="Номер группы:").pack()
+        self.group_entry = ttk.Entry(scrollable_frame, width=40)
+        self.group_entry.pack(pady=(0, 15))
+
+        self.exams_frame = LabelFrame(scrollable_frame, text="Экзамены")
+        self.exams_frame.pack(fill=X, pady=5)
+
+        ttk.Button(
+            scrollable_frame,
+            text="Добавить экзамен",
+            command=self.add_exam_field).pack(
+            pady=5)
+        self.exam_entries = []
+        self.add_exam_field()
+
+        buttons_frame = Frame(scrollable_frame)
+        buttons_frame.pack(pady=10)
+
+        ttk.Button(
+            buttons_frame,
+            text="Сохранить",
+            command=self.save_student).pack(
+            side=LEFT,
+            padx=5)
+        ttk.Button(
+            buttons_frame,
+            text="Отмена",
+            command=self.window.destroy).pack(
+            side=LEFT,
+            padx=5)
+
+    def add_exam_field(self):
+        exam_frame = Frame(self.exams_frame)
+        exam_frame.pack(fill=X, pady=2)
+
+        ttk.Label(exam_frame, text="Предмет:").pack(side=LEFT, padx=(0, 5))
+        subject_entry = ttk.Entry(exam_frame, width=20)
+        subject_entry.pack(side=LEFT)
+
+        ttk.Label(exam_frame, text="Оценка:").pack(side=LEFT, padx=(10, 5))
+        grade_entry = ttk.Entry(exam_frame, width=5)
+        grade_entry.pack(side=LEFT)
+
+        ttk.Button(
+            exam_frame,
+            text="✕",
+            width=3,
+            command=lambda f=exam_frame: self.remove_exam_field(f)).pack(
+            side=RIGHT,
+            padx=(
+                5,
+                0))
+        self.exam_entries.append((subject_entry, grade_entry))
+
+    def remove_exam_field(self, frame):
+        for entry_pair in self.exam_entries:
+            if entry_pair[0].master == frame:
+                self.exam_entries.remove(entry_pair)
+                break
+        frame.destroy()
+
+    def save_student(self):
+        fio = self.fio_entry.get().strip()
+        group = self.group_entry.get().strip()
+        exams = {}
+        for subject_entry, grade_entry in self.exam_entries:
+            subject = subject_entry.get().strip()
+            grade = grade_entry.get().strip()
+            if not subject:
+                messagebox.showerror("Ошибка", "Введите название экзамена")
+                return
+            if not grade:
+                messagebox.showerror("Ошибка", "Введите балл за экзамен")
+                return
+            try:
+                exams[subject] = int(grade)
+            except ValueError:
+                messagebox.showerror(
+                    "Ошибка", f"Некорректная оценка для предмета '{subject}'")
+                return
+
+        if not fio or not group or not exams:
+            messagebox.showerror(
+                "Ошибка", "Заполните все поля и добавьте хотя бы один экзамен")
+            return
+
+        student_data = {'fio': fio, 'group': group, 'exams': exams}
+        if self.controller.create(student_data) == True:
+            messagebox.showinfo(
+                "Успешно", f"Студент {
+                    student_data['fio']} успешно добавлен!")
+            self.window.destroy()
+            self.refresh_data()
+        else:
+            messagebox.showerror(
+                "Ошибка ввода данных", "\n".join(
+                    self.controller.create(student_data)))
+
+    def refresh_data(self):
+        self.paginator.update_total_records()
+        self.paginator.first_page()
+        self.update_view()
+
+    def find_note(self):
+        self.search_window = Toplevel()
+        self.search_window.title("Поиск студентов")
+        self.search_window.resizable(False, False)
+
+        search_frame = Frame(self.search_window)
+        search_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        search_criteria_frame = LabelFrame(
+            search_frame, text="Критерии поиска")
+        search_criteria_frame.pack(fill=X, pady=5)
+
+        self.search_mode = StringVar(value="group")
+        search_options = [
+            ("По номеру группы", "group"),
+            ("По среднему баллу студента и наличию экзамена", "avg_grade"),
+            ("По баллу за конкретный экзамен", "exam_grade"),
+            ("По ФИО", "fio")
+        ]
+
+        for i, (text, mode) in enumerate(search_options):
+            rb = Radiobutton(search_criteria_frame, text=text, variable=self.search_mode,
+                             value=mode, command=self.toggle_live_search_fields)
+            rb.grid(row=0, column=i, padx=5, pady=5, sticky=W)
+
+        self.search_input_frame = Frame(search_criteria_frame)
+        self.search_input_frame.grid(
+            row=1, column=0, columnspan=4, sticky=EW, pady=5)
+
+        search_btn = Button(
+            search_criteria_frame,
+            text="Найти",
+            command=lambda: self.perform_live_search(delay=0, warn=True))
+        search_btn.grid(row=2, column=0, columnspan=4, pady=10)
+
+        results_frame = LabelFrame(search_frame, text="Результаты поиска")
+        results_frame.pack(fill=BOTH, expand=True, pady=5)
+
+        self.results_tree = ttk.Treeview(results_frame, columns=(
+            "fio", "group", "exams", "avg_grade"), show="headings")
+        self.results_tree.heading("fio", text="ФИО")
+        self.results_tree.heading("group", text="Группа")
+        self.results_tree.heading("exams", text="Экзамены")
+        self.results_tree.heading("avg_grade", text="Ср. балл")
+        self.results_tree.column("fio", width=200, anchor=W)
+        self.results_tree.column("group", width=100, anchor=CENTER)
+        self.results_tree.column("exams", width=300, anchor=W)
+        self.results_tree.column("avg_grade", width=80, anchor=CENTER)
+
+        scroll_y = ttk.Scrollbar(
+            results_frame,
+            orient=VERTICAL,
+            command=self.results_tree.yview)
+        scroll_x = ttk.Scrollbar(
+            results_frame,
+            orient=HORIZONTAL,
+            command=self.results_tree.xview)
+        self.results_tree.configure(
+            yscrollcommand=scroll_y.set,
+            xscrollcommand=scroll_x.set)
+
+        self.search_status = Label(search_frame, text="", anchor=W)
+        self.search_status.pack(fill=X)
+
+        self.results_tree.pack(side=LEFT, fill=BOTH, expand=True)
+        scroll_y.pack(side=RIGHT, fill=Y)
+        scroll_x.pack(side=BOTTOM, fill=X)
+
+        self.live_search = LiveSearch(
+            self.search_window, self.controller, self.results_tree, self.search_status)
+        self.search_window.protocol("WM_DELETE_WINDOW", self.close_find_note)
+        self.toggle_live_search_fields()
+
+    def close_find_note(self):
+        self.live_search.shutdown()
+        self.search_window.destroy()
+
+    def toggle_live_search_fields(self):
+        self.live_search.cancel()
+        self.results_tree.delete(*self.results_tree.get_children())
+        self.search_status.config(text="")
+        self.toggle_search_fields()
+        for widget in self.search_input_frame.winfo_children():
+            if isinstance(widget, Entry):
+                widget.bind("<KeyRelease>", self.on_search_input)
+
+    def on_search_input(self, event):
+        if event.keysym == "Return":
+            self.perform_live_search(delay=0, warn=True)
+        elif event.char or event.keysym in ("BackSpace", "Delete"):
+            self.perform_live_search()
+
+    def perform_live_search(self, delay=LiveSearch.DELAY, warn=False):
+        search = self.build_search(warn)
+        if search is None:
+            self.live_search.cancel()
+            self.results_tree.delete(*self.results_tree.get_children())
+            self.search_status.config(text="")
+            return
+        self.live_search.schedule(search, delay)
+
+    def toggle_search_fields(self):
+        for widget in self.search_input_frame.winfo_children():
+            widget.destroy()
+
+        mode = self.search_mode.get()
+        if mode == "group":
+            self.group_label = Label(
+                self.search_input_frame,
+                text="Номер группы:")
+            self.group_entry = Entry(self.search_input_frame, width=20)
+            self.group_label.grid(row=0, column=0, padx=5, pady=5, sticky=E)
+            self.group_entry.grid(row=0, column=1, padx=5, pady=5, sticky=W)
+        elif mode == "avg_grade":
+            self.avg_min_label = Label(
+                self.search_input_frame,
+                text="Средний балл от:")
+            self.avg_min_entry = Entry(self.search_input_frame, width=5)
+            self.avg_max_label = Label(self.search_input_frame, text="до:")
+            self.avg_max_entry = Entry(self.search_input_frame, width=5)
+            self.exam1_name_label = Label(
+                self.search_input_frame, text="Название экзамена:")
+            self.exam1_name_entry = Entry(self.search_input_frame, width=20)
+            self.avg_min_label.grid(row=1, column=0, padx=5, pady=5, sticky=E)
+            self.avg_min_entry.grid(row=1, column=1, padx=5, pady=5, sticky=W)
+            self.avg_max_label.grid(row=1, column=2, padx=5, pady=5, sticky=E)
+            self.avg_max_entry.grid(row=1, column=3, padx=5, pady=5, sticky=W)
+            self.exam1_name_label.grid(
+                row=0, column=0, padx=5, pady=5, sticky=E)
+            self.exam1_name_entry.grid(
+                row=0, column=1, padx=5, pady=5, sticky=W)
+        elif mode == "exam_grade":
+            self.exam_name_label = Label(
+                self.search_input_frame,
+                text="Название экзамена:")
+            self.exam_name_entry = Entry(self.search_input_frame, width=20)
+            self.exam_min_label = Label(
+                self.search_input_frame, text="Балл от:")
+            self.exam_min_entry = Entry(self.search_input_frame, width=5)
+            self.exam_max_label = Label(self.search_input_frame, text="до:")
+            self.exam_max_entry = Entry(self.search_input_frame, width=5)
+            self.exam_name_label.grid(
+                row=0, column=0, padx=5, pady=5, sticky=E)
+            self.exam_name_entry.grid(
+                row=0, column=1, padx=5, pady=5, sticky=W)
+            self.exam_min_label.grid(row=1, column=0, padx=5, pady=5, sticky=E)
+            self.exam_min_entry.grid(row=1, column=1, padx=5, pady=5, sticky=W)
+            self.exam_max_label.grid(row=1, column=2, padx=5, pady=5, sticky=E)
+            self.exam_max_entry.grid(row=1, column=3, padx=5, pady=5, sticky=W)
+        elif mode == "fio":
+            self.fio_label = Label(
+                self.search_input_frame,
+                text="ФИО:")
+            self.fio_search_entry = Entry(self.search_input_frame, width=40)
+            self.fio_label.grid(row=0, column=0, padx=5, pady=5, sticky=E)
+            self.fio_search_entry.grid(
+                row=0, column=1, padx=5, pady=5, sticky=W)
+
+    def build_search(self, warn=True):
+        def warning(title, text):
+            if warn:
+                messagebox.showwarning(title, text)
+
+        mode = self.search_mode.get()
+        try:
+            if mode == "group":
+                group = self.group_entry.get().strip()
+                if not group:
+                    warning("Ошибка", "Введите номер группы")
+                    return None
+                def search(controller, report):
+                    return controller.search_by_group(group)
+            elif mode == "avg_grade":
+                exam_name1 = self.exam1_name_entry.get().strip()
+                if not exam_name1 or not self.avg_min_entry.get() or not self.avg_max_entry.get():
+                    warning("Ошибка", "Заполните все поля")
+                    return None
+                min_avg = int(self.avg_min_entry.get())
+                max_avg = int(self.avg_max_entry.get())
+                def search(controller, report):
+                    return controller.search_by_avg_grade(
+                        exam_name1, min_avg, max_avg)
+            elif mode == "exam_grade":
+                exam_name = self.exam_name_entry.get().strip()
+                if not exam_name or not self.exam_min_entry.get() or not self.exam_max_entry.get():
+                    warning("Ошибка", "Заполните все поля")
+                    return None
+                min_grade = float(self.exam_min_entry.get())
+                max_grade = float(self.exam_max_entry.get())
+                def search(controller, report):
+                    return controller.search_by_exam_grade(
+                        exam_name, min_grade, max_grade)
+            elif mode == "fio":
+                fio = self.fio_search_entry.get().strip()
+                if not fio:
+                    warning("Ошибка", "Введите ФИО")
+                    return None
+                def search(controller, report):
+                    return controller.search_by_fio(fio)
+        except ValueError:
+            if warn:
+                messagebox.showerror("Ошибка", "Некорректный формат данных")
+            return None
+        return search
+
+    def perform_search(self, on_found=None):
+        for item in self.results_tree.get_children():
+            self.results_tree.delete(item)
+
+        search = self.build_search()
+        if search is None:
+            return
+
+        def show_results(result, cancelled):
+            if cancelled:
+                self.results = []
+            elif isinstance(result, list):
+                self.results = result
+                self.display_results()
+                if on_found:
+                    on_found()
+            else:
+                messagebox.showerror("Ошибка ввода данных", result)
+                self.results = []
+
+        self.run_task("Поиск студентов", search, show_results)
+
+    def display_results(self):
+        if not self.results:
+            messagebox.showinfo("Результаты", "Студенты не найдены")
+            return
+        found_students = 0
+        for student in self.results:
+            found_students += 1
+            self.results_tree.insert("", "end", values=student_row(student))
+        messagebox.showinfo("Результаты",
+                            f"Студентов найдено: {found_students}")
+
+    def delete_note(self):
+        self.deletion_window = Toplevel()
+        self.deletion_window.title("Удаление студентов")
+        self.deletion_window.resizable(False, False)
+
+        deletion_frame = Frame(self.deletion_window)
+        deletion_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        search_criteria_frame = LabelFrame(
+            deletion_frame, text="Критерии поиска")
+        search_criteria_frame.pack(fill=X, pady=5)
+
+        self.search_mode = StringVar(value="group")
+        search_options = [
+            ("По номеру группы", "group"),
+            ("По среднему баллу студента и наличию экзамена", "avg_grade"),
+            ("По баллу за конкретный экзамен", "exam_grade")
+        ]
+
+        for i, (text, mode) in enumerate(search_options):
+            rb = Radiobutton(search_criteria_frame, text=text, variable=self.search_mode,
+                             value=mode, command=self.toggle_search_fields)
+            rb.grid(row=0, column=i, padx=5, pady=5, sticky=W)
+
+        self.search_input_frame = Frame(search_criteria_frame)
+        self.search_input_frame.grid(
+            row=1, column=0, columnspan=3, sticky=EW, pady=5)
+
+        search_btn = Button(
+            search_criteria_frame,
+            text="Найти и удалить",
+            command=self.perform_search_for_deletion)
+        search_btn.grid(row=2, column=0, columnspan=3, pady=10)
+
+        results_frame = LabelFrame(
+            deletion_frame,
+            text="Результаты: записи, которые были удалены")
+        results_frame.pack(fill=BOTH, expand=True, pady=5)
+
+        self.results_tree = ttk.Treeview(results_frame, columns=(
+            "fio", "group", "exams", "avg_grade"), show="headings")
+        self.results_tree.heading("fio", text="ФИО")
+        self.results_tree.heading("group", text="Группа")
+        self.results_tree.heading("exams", text="Экзамены")
+        self.results_tree.heading("avg_grade", text="Ср. балл")
+        self.results_tree.column("fio", width=200, anchor=W)
+        self.results_tree.column("group", width=100, anchor=CENTER)
+        self.results_tree.column("exams", width=300, anchor=W)
+        self.results_tree.column("avg_grade", width=80, anchor=CENTER)
+
+        scroll_y = ttk.Scrollbar(
+            results_frame,
+            orient=VERTICAL,
+            command=self.results_tree.yview)
+        scroll_x = ttk.Scrollbar(
+            results_frame,
+            orient=HORIZONTAL,
+            command=self.results_tree.xview)
+        self.results_tree.configure(
+            yscrollcommand=scroll_y.set,
+            xscrollcommand=scroll_x.set)
+
+        self.results_tree.pack(side=LEFT, fill=BOTH, expand=True)
+        scroll_y.pack(side=RIGHT, fill=Y)
+        scroll_x.pack(side=BOTTOM, fill=X)
+        self.toggle_search_fields()
+
+    def perform_search_for_deletion(self):
+        self.results = []
+        self.perform_search(on_found=self.delete_results)
+
+    def delete_results(self):
+        if self.results:
+            success, failed = self.controller.delete(self.results)
+            messagebox.showinfo(
+                "Удаление", f"Удалено успешно: {success}, неудач: {failed}")
+            self.refresh_data()
+
+    def show_stats(self):
+        def collect(controller, report):
+            return (controller.get_group_stats(),
+                    controller.get_subject_stats(),
+                    controller.get_top_students())
+
+        def on_done(result, cancelled):
+            if cancelled:
+                return
+            if not result:
+                messagebox.showerror("Ошибка", "Не удалось получить статистику")
+                return
+            self.show_stats_window(*result)
+
+        self.run_task("Подсчёт статистики", collect, on_done)
+
+    def show_stats_window(self, group_stats, subject_stats, top_students):
+        self.stats_window = Toplevel()
+        self.stats_window.title("Статистика")
+        self.stats_window.geometry("600x400")
+
+        notebook = ttk.Notebook(self.stats_window)
+        notebook.pack(fill=BOTH, expand=True, padx=10, pady=10)
+
+        groups_tree = self.create_stats_tree(notebook, "По группам", [
+            ("group", "Группа", 150),
+            ("students", "Студентов", 150),
+            ("avg_grade", "Ср. балл", 150)])
+        for stats in group_stats:
+            groups_tree.insert("", "end", values=(
+                stats['group'], stats['students'], stats['avg_grade']))
+
+        subjects_tree = self.create_stats_tree(notebook, "По предметам", [
+            ("subject", "Предмет", 150),
+            ("count", "Оценок", 80),
+            ("avg_grade", "Ср. балл", 80),
+            ("distribution", "Распределение оценок", 250)])
+        for stats in subject_stats:
+            distribution = ", ".join(
+                f"{grade}: {count}" for grade, count in stats['distribution'].items())
+            subjects_tree.insert("", "end", values=(
+                stats['subject'], stats['count'], stats['avg_grade'],
+                distribution))
+
+        top_tree = self.create_stats_tree(notebook, "Лучшие студенты", [
+            ("fio", "ФИО", 250),
+            ("group", "Группа", 100),
+            ("avg_grade", "Ср. балл", 100)])
+        for student in top_students:
+            top_tree.insert("", "end", values=(
+                student['fio'], student['group'], student['avg_grade']))
+
+    def create_stats_tree(self, notebook, title, columns):
+        frame = Frame(notebook)
+        notebook.add(frame, text=title)
+        tree = ttk.Treeview(frame, columns=[name for name, _, _ in columns],
+                            show="headings")
+        for name, heading, width in columns:
+            tree.heading(name, text=heading)
+            tree.column(name, width=width, anchor=W)
+        scroll_y = ttk.Scrollbar(frame, orient=VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scroll_y.set)
+        tree.pack(side=LEFT, fill=BOTH, expand=True)
+        scroll_y.pack(side=RIGHT, fill=Y)
+        return tree
+
+    def show_debug_panel(self):
+        instrumentation = self.controller.instrumentation
+        if instrumentation is None:
+            messagebox.showinfo(
+                "Отладка",
+                "Сбор статистики выключен. Запустите приложение с "
+                "переменной окружения STUDENTS_STATS=<файл.json|файл.csv>")
+            return
+
+        window = Toplevel()
+        window.title("Отладка")
+        window.geometry("900x400")
+
+        notebook = ttk.Notebook(window)
+        notebook.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        columns = [
+            ("calls", "Вызовов", 70),
+            ("avg", "Ср., мс", 70),
+            ("p50", "p50, мс", 70),
+            ("p95", "p95, мс", 70),
+            ("max", "Макс., мс", 70),
+            ("rows", "Строк", 70),
+            ("bytes", "Байт", 90)]
+        trees = {
+            "controller": self.create_stats_tree(
+                notebook, "Контроллер", [("name", "Метод", 200)] + columns),
+            "sql": self.create_stats_tree(
+                notebook, "SQL", [("name", "Запрос", 400)] + columns)}
+
+        buttons = Frame(window)
+        buttons.pack(fill=X, padx=10, pady=(0, 10))
+        ttk.Button(buttons, text="Сбросить",
+                   command=instrumentation.reset).pack(side=LEFT)
+        ttk.Button(buttons, text="Записать в файл",
+                   command=instrumentation.flush).pack(side=LEFT, padx=5)
+
+        def refresh():
+            if not window.winfo_exists():
+                return
+            for tree in trees.values():
+                tree.delete(*tree.get_children())
+            for kind, name, stats in instrumentation.snapshot():
+                trees[kind].insert("", "end", values=(
+                    name, stats['calls'],
+                    *(f"{stats[key] * 1000:.2f}"
+                      for key in ("avg", "p50", "p95", "max")),
+                    stats['rows'], stats['bytes']))
+            window.after(1000, refresh)
+        refresh()
+
+    def clear_db(self):
+        if self.controller.clear_db():
+            messagebox.showinfo("Успех", "База данных успешно очищена")
+            self.refresh_data()
+        else:
+            messagebox.showerror("Ошибка", "Не удалось очистить базу данных")
+
+    def find_path(self):
+        file_path = filedialog.askopenfilename(
+            filetypes=[("XML files", "*.xml")],
+            title="Выберите XML файл"
+        )
+        return file_path
+
+    def find_path_sql(self):
+        file_path = filedialog.askopenfilename(
+            filetypes=[("SQL files", "*.sql"), ("All files", "*.*")],
+            title="Выберите SQL файл для загрузки"
+        )
+        return file_path
+
+    def find_path_snapshot(self):
+        file_path = filedialog.askopenfilename(
+            filetypes=[("SQLite snapshot", "*.db"), ("All files", "*.*")],
+            title="Выберите снимок базы данных"
+        )
+        return file_path
+
+    def load_state(self):
+        file_path = self.find_path()
+        if not file_path:
+            return
+        clear = messagebox.askyesno(
+            "Подтверждение", "Очистить текущую базу данных перед загрузкой?")
+
+        def load(controller, report):
+            if clear and not controller.clear_db():
+                return False
+            return controller.load(file_path, progress=report)
+
+        self.run_task(
+            "Загрузка из XML",
+            load,
+            lambda result, cancelled: self.finish_write_task(
+                result, cancelled,
+                "Данные успешно загружены из файла",
+                "Не удалось загрузить данные из файла"))
+
+    def save_data(self):
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".xml", filetypes=[
+                ("XML files", "*.xml")], title="Сохранить базу данных")
+        if file_path:
+            self.run_task(
+                "Сохранение в XML",
+                lambda controller, report: controller.save_to_xml(
+                    file_path, progress=report),
+                lambda result, cancelled: self.finish_export_task(
+                    result, cancelled,
+                    "База данных успешно сохранена",
+                    "Не удалось сохранить данные"))
+
+    def save_to_sql(self):
+        file_path = filedialog.asksaveasfilename(defaultextension=".sql", filetypes=[(
+            "SQL files", "*.sql"), ("All files", "*.*")], title="Сохранить базу данных как SQL")
+        if file_path:
+            self.run_task(
+                "Экспорт в SQL",
+                lambda controller, report: controller.save_to_sql(
+                    file_path, progress=report),
+                lambda result, cancelled: self.finish_export_task(
+                    result, cancelled,
+                    "База данных успешно экспортирована в SQL",
+                    "Не удалось экспортировать данные"))
+
+    def load_from_sql(self):
+        file_path = self.find_path_sql()
+        if not file_path:
+            return
+        clear = messagebox.askyesno(
+            "Подтверждение", "Очистить текущую базу данных перед загрузкой?")
+
+        def load(controller, report):
+            if clear and not controller.clear_db():
+                return False
+            return controller.load_from_sql(file_path, progress=report)
+
+        self.run_task(
+            "Загрузка из SQL",
+            load,
+            lambda result, cancelled: self.finish_write_task(
+                result, cancelled,
+                "Данные успешно загружены из SQL",
+                "Ошибка загрузки SQL файла"))
+
+    def save_snapshot(self):
+        file_path = filedialog.asksaveasfilename(defaultextension=".db", filetypes=[(
+            "SQLite snapshot", "*.db"), ("All files", "*.*")], title="Сохранить снимок базы данных")
+        if file_path:
+            self.run_task(
+                "Сохранение снимка",
+                lambda controller, report: controller.save_snapshot(
+                    file_path, progress=report),
+                lambda result, cancelled: self.finish_export_task(
+                    result, cancelled,
+                    "Снимок базы данных сохранен",
+                    "Не удалось сохранить снимок"))
+
+    def load_snapshot(self):
+        file_path = self.find_path_snapshot()
+        if not file_path:
+            return
+        if not messagebox.askyesno(
+                "Подтверждение", "Текущая база данных будет заменена снимком. Продолжить?"):
+            return
+        self.run_task(
+            "Восстановление из снимка",
+            lambda controller, report: controller.load_snapshot(
+                file_path, progress=report),
+            lambda result, cancelled: self.finish_write_task(
+                result, cancelled,
+                "База данных восстановлена из снимка",
+                "Не удалось загрузить снимок"))
+
+    def Menu(self):
+        btn_frame = Frame(self.root)
+        btn_frame.pack(fill=X, padx=5, pady=5)
+        ttk.Button(
+            btn_frame,
+            text="Создать запись",
+            command=self.create_note).pack(
+            side=LEFT,
+            padx=5)
+        ttk.Button(
+            btn_frame,
+            text="Удалить запись",
+            command=self.delete_note).pack(
+            side=LEFT,
+            padx=5)
+        ttk.Button(
+            btn_frame,
+            text="Найти запись",
+            command=self.find_note).pack(
+            side=LEFT,
+            padx=5)
+        ttk.Button(
+            btn_frame,
+            text="Загрузить из XML",
+            command=self.load_state).pack(
+            side=LEFT,
+            padx=5)
+        ttk.Button(
+            btn_frame,
+            text="Сохранить в XML",
+            command=self.save_data).pack(
+            side=LEFT,
+            padx=5)
+        ttk.Button(
+            btn_frame,
+            text="Загрузить из БД",
+            command=self.load_from_sql).pack(
+            side=LEFT,
+            padx=5)
+        ttk.Button(
+            btn_frame,
+            text="Сохранить в БД",
+            command=self.save_to_sql).pack(
+            side=LEFT,
+            padx=5)
+
+        snapshot_frame = Frame(self.root)
+        snapshot_frame.pack(fill=X, padx=5)
+        ttk.Button(
+            snapshot_frame,
+            text="Загрузить снимок",
+            command=self.load_snapshot).pack(
+            side=RIGHT,
+            padx=5)
+        ttk.Button(
+            snapshot_frame,
+            text="Сохранить снимок",
+            command=self.save_snapshot).pack(
+            side=RIGHT,
+            padx=5)
+        ttk.Button(
+            snapshot_frame,
+            text="Статистика",
+            command=self.show_stats).pack(
+            side=LEFT,
+            padx=5)
+        ttk.Button(
+            snapshot_frame,
+            text="Отладка",
+            command=self.show_debug_panel).pack(
+            side=LEFT,
+            padx=5)
+
+    def createViewToggle(self):
+        toggle_frame = Frame(self.root)
+        toggle_frame.pack(fill=X, padx=5, pady=2)
+        self.view_var = StringVar(value="table")
+        ttk.Radiobutton(
+            toggle_frame,
+            text="Таблица",
+            variable=self.view_var,
+            value="table",
+            command=self.toggle_view).pack(
+            side=LEFT,
+            padx=5)
+        ttk.Radiobutton(
+            toggle_frame,
+            text="Дерево",
+            variable=self.view_var,
+            value="tree",
+            command=self.toggle_view).pack(
+            side=LEFT,
+            padx=5)
+
+    def toggle_view(self):
+        self.view_mode = self.view_var.get()
+        if self.view_mode == "table":
+            self.tree_view.pack_forget()
+            self.table_view.pack()
+        else:
+            self.table_view.pack_forget()
+            self.tree_view.pack()
+        self.update_view()
+
+    def createPaginationControls(self):
+        pagination_frame = Frame(self.root)
+        pagination_frame.pack(fill=X, padx=5, pady=5)
+
+        ttk.Label(
+            pagination_frame,
+            text="Записей на странице:").pack(
+            side=LEFT,
+            padx=5)
+        self.records_var = StringVar(
+            value=str(self.paginator.records_per_page))
+        records_combo = ttk.Combobox(
+            pagination_frame, textvariable=self.records_var, values=[
+                1, 5, 10, 15, 20, 25, 50], width=5)
+        records_combo.pack(side=LEFT, padx=5)
+        records_combo.bind(
+            "<<ComboboxSelected>>",
+            self.change_records_per_page)
+
+        ttk.Button(
+            pagination_frame,
+            text="<< Первая",
+            command=self.first_page).pack(
+            side=LEFT,
+            padx=5)
+        ttk.Button(
+            pagination_frame,
+            text="< Предыдущая",
+            command=self.prev_page).pack(
+            side=LEFT,
+            padx=5)
+
+        self.page_info_frame = Frame(pagination_frame)
+        self.page_info_frame.pack(side=LEFT, padx=5)
+
+        self.page_label = ttk.Label(
+            self.page_info_frame, text=f"Страница {
+                self.paginator.current_page} из {
+                self.paginator.get_total_pages()}")
+        self.page_label.pack()
+
+        self.total_records_label = ttk.Label(
+            self.page_info_frame, text=f"Всего записей: {
+                self.paginator.total_records}")
+        self.total_records_label.pack()
+
+        ttk.Button(
+            pagination_frame,
+            text="Следующая >",
+            command=self.next_page).pack(
+            side=LEFT,
+            padx=5)
+        ttk.Button(
+            pagination_frame,
+            text="Последняя >>",
+            command=self.last_page).pack(
+            side=LEFT,
+            padx=5)
+
+        self.page_entry = ttk.Entry(pagination_frame, width=5)
+        self.page_entry.pack(side=LEFT, padx=5)
+        self.page_entry.bind("<Return>", lambda e: self.go_to_page())
+        ttk.Button(
+            pagination_frame,
+            text="Перейти",
+            command=self.go_to_page).pack(
+            side=LEFT,
+            padx=5)
+
+    def update_pagination_info(self):
+        self.page_label.config(
+            text=f"Страница {
+                self.paginator.current_page} из {
+                self.paginator.get_total_pages()}")
+        self.total_records_label.config(
+            text=f"Всего записей: {
+                self.paginator.total_records}")
+
+    def change_records_per_page(self, event):
+        self.paginator.set_records_per_page(int(self.records_var.get()))
+        self.update_view()
+
+    def first_page(self):
+        self.paginator.first_page()
+        self.update_view()
+
+    def prev_page(self):
+        self.paginator.prev_page()
+        self.update_view()
+
+    def next_page(self):
+        self.paginator.next_page()
+        self.update_view()
+
+    def last_page(self):
+        self.paginator.last_page()
+        self.update_view()
+
+    def go_to_page(self):
+        try:
+            page = int(self.page_entry.get())
+        except ValueError:
+            messagebox.showerror("Ошибка", "Введите номер страницы")
+            return
+        self.paginator.go_to_page(page)
+        self.update_view()
+
+    def update_view(self):
+        if self.view_mode == "table":
+            self.table_view.draw_table()
+        else:
+            self.tree_view.show_tree_view()
+        self.update_pagination_info()
+        self.paginator.prefetch_adjacent()